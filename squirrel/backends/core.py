@@ -66,6 +66,7 @@ class _Backend:
         - lt (less than or equal to)
         - gt (greater than or equal to)
         - in
+        - between (lower <= value <= upper, takes a (lower, upper) tuple)
         - like (fuzzy match, depends on type of value)
         """
         raise NotImplementedError
@@ -104,6 +105,9 @@ class _Backend:
                 return data >= target
         elif op == "in":
             return data in target
+        elif op == "between":
+            lower, upper = target
+            return lower <= data <= upper
         elif op == "like":
             if isinstance(data, UUID):
                 data = str(data)
@@ -34,6 +34,9 @@ class MongoBackend(_Backend):
         self.address = address
         self._tag_cache = {}
         self._last_tag_fetch = datetime.now() - timedelta(minutes=1)
+        # tag id -> group id, derived from self._tag_cache by _tag_group_index
+        self._tag_group_index = {}
+        self._tag_group_index_source = None
 
     def search(self, *search_terms: SearchTermType, meta_pvs=None):
         """
@@ -544,18 +547,33 @@ class MongoBackend(_Backend):
         TagSet
             Tags for one PV formatted as a TagSet
         """
-        tag_def = self.get_tags()
-        id_to_group = {
-            tag_id: group for group, group_def in tag_def.items() for tag_id in group_def[2]
-        }
+        id_to_group = self._get_tag_group_index()
         tag_set = {}
         for d in tag_list:
-            group = id_to_group[d["id"]]
+            try:
+                group = id_to_group[d["id"]]
+            except KeyError:
+                # tag definition may have been edited in place since indexing
+                group = self._get_tag_group_index(rebuild=True)[d["id"]]
             if group not in tag_set:
                 tag_set[group] = set()
             tag_set[group].add(d["id"])
         return tag_set
 
+    def _get_tag_group_index(self, rebuild: bool = False) -> dict[int, int]:
+        """
+        Return a mapping of tag id to the id of the group containing it.  The
+        mapping is rebuilt only when the tag definition is re-fetched, rather
+        than once per unpacked PV.
+        """
+        tag_def = self.get_tags()
+        if rebuild or tag_def is not self._tag_group_index_source:
+            self._tag_group_index = {
+                tag_id: group for group, group_def in tag_def.items() for tag_id in group_def[2]
+            }
+            self._tag_group_index_source = tag_def
+        return self._tag_group_index
+
     @staticmethod
     def _pack_tags(tags: TagSet) -> Iterable[int]:
         """
@@ -625,27 +643,40 @@ class MongoBackend(_Backend):
             description=metadata_dict["description"],
             # tags=metadata_dict["tags"],
             meta_pvs=[
-                PV(
-                    setpoint=pv.get("setpointAddress", ""),
-                    setpoint_data=EpicsData(
-                        data=pv.get("data", None),
-                        status=getattr(Status, pv["status"]),
-                        severity=getattr(Severity, pv["severity"]),
-                        timestamp=datetime.fromisoformat(pv["createdDate"]).replace(tzinfo=UTC),
-                    ),
-                    readback=pv.get("readbackAddress", ""),
-                    readback_data=EpicsData(
-                        data=pv.get("data", None),
-                        status=getattr(Status, pv["status"]),
-                        severity=getattr(Severity, pv["severity"]),
-                        timestamp=datetime.fromisoformat(pv["createdDate"]).replace(tzinfo=UTC),
-                    ),
-                    creation_time=datetime.fromisoformat(pv["createdDate"]).replace(tzinfo=UTC),
-                ) for pv in metadata_dict["metadataPVs"]
+                MongoBackend._unpack_meta_pv(pv) for pv in metadata_dict["metadataPVs"]
             ],
             creation_time=datetime.fromisoformat(metadata_dict["createdDate"]).replace(tzinfo=UTC),
         )
 
+    @staticmethod
+    def _unpack_meta_pv(pv_dict) -> PV:
+        """
+        Converts one meta PV entry from snapshot metadata into a PV instance.
+        The same reading populates both setpoint and readback data, so the
+        timestamp is only parsed once.
+
+        Parameters
+        ----------
+        pv_dict : dict
+            Encoded meta PV data received from the backend
+
+        Returns
+        -------
+        PV
+            PV instance containing the meta PV's address and data
+        """
+        created = datetime.fromisoformat(pv_dict["createdDate"]).replace(tzinfo=UTC)
+        status = getattr(Status, pv_dict["status"])
+        severity = getattr(Severity, pv_dict["severity"])
+        data = pv_dict.get("data", None)
+        return PV(
+            setpoint=pv_dict.get("setpointAddress", ""),
+            setpoint_data=EpicsData(data=data, status=status, severity=severity, timestamp=created),
+            readback=pv_dict.get("readbackAddress", ""),
+            readback_data=EpicsData(data=data, status=status, severity=severity, timestamp=created),
+            creation_time=created,
+        )
+
     def _unpack_snapshot(self, snapshot_dict) -> Snapshot:
         """
         Converts data received from backend endpoints into a complete Snapshot
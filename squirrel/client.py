@@ -1,22 +1,106 @@
 """Client for squirrel.  Used for programmatic interactions with squirrel"""
+from __future__ import annotations
+
 import configparser
-import copy
 import logging
 import os
+from functools import cache
 from pathlib import Path
-from typing import Any, Generator, Iterable, Optional, Union
+from typing import TYPE_CHECKING, Any, Generator, Iterable, Optional, Union
 
 from squirrel.backends import SearchTerm, SearchTermType, _Backend, get_backend
-from squirrel.control_layer import ControlLayer, TaskStatus
 from squirrel.model import PV, EpicsData, Snapshot
 from squirrel.utils import build_abs_path
 
+if TYPE_CHECKING:
+    # The control layer pulls in the EPICS client libraries, so it is only imported
+    # once a Client needs to build one
+    from squirrel.control_layer import ControlLayer, TaskStatus
+
 logger = logging.getLogger(__name__)
 
 
+def __getattr__(name: str) -> Any:
+    """
+    Import ``ControlLayer`` and ``TaskStatus`` lazily on attribute access.
+    ``typing.get_type_hints`` reads the module namespace directly, so pass these
+    in ``localns`` to resolve the ``Client`` annotations.
+    """
+    if name in ("ControlLayer", "TaskStatus"):
+        import squirrel.control_layer
+        return getattr(squirrel.control_layer, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 Entry = Union[PV, Snapshot]
 
 
+@cache
+def _find_config(squirrel_cfg: str, xdg_config_home: str, user_config: str) -> str:
+    """
+    Cached body of :meth:`Client.find_config`, keyed by the environment it reads.
+    Call ``_find_config.cache_clear()`` if config files are added or removed at runtime.
+    """
+    # Point to with an environment variable
+    if squirrel_cfg:
+        logger.debug("Found $SQUIRREL_CFG specification for Client "
+                     "configuration at %s", squirrel_cfg)
+        return squirrel_cfg
+    # Search in the current directory and home directory
+    for directory in (xdg_config_home, user_config):
+        logger.debug('Searching for squirrel config in %s', directory)
+        for path in ('.squirrel.cfg', 'squirrel.cfg'):
+            full_path = os.path.join(directory, path)
+
+            if os.path.exists(full_path):
+                logger.debug("Found configuration file at %r", full_path)
+                return full_path
+    # If found nothing
+    default_config = os.path.join(os.path.dirname(__file__), "tests/demo.cfg")
+    if os.path.isfile(default_config):
+        return default_config
+    else:
+        raise OSError("No squirrel configuration file found")
+
+
+# config path -> (modification time, parsed config)
+_parsed_configs: dict[str, tuple[tuple[int, int], configparser.ConfigParser]] = {}
+
+
+def _read_config(cfg: str) -> configparser.ConfigParser:
+    """
+    Parse the config file at ``cfg``, reusing the previous parse if the file's
+    modification time and size are unchanged.  Raises FileNotFoundError if
+    ``cfg`` does not exist.
+    """
+    cfg = str(cfg)
+    stat = os.stat(cfg)
+    # size catches rewrites that land within the same mtime tick
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _parsed_configs.get(cfg)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    # config files are small; read it with one unbuffered call and parse in memory
+    with open(cfg, 'rb', buffering=0) as f:
+        contents = f.read()
+    cfg_parser = configparser.ConfigParser()
+    cfg_parser.read_string(contents.decode(), source=cfg)
+    logger.debug(f"Loading configuration file at ({cfg})")
+    _parsed_configs[cfg] = (key, cfg_parser)
+    return cfg_parser
+
+
+def _copy_pv(pv: PV) -> PV:
+    """
+    Shallow-copy ``pv`` without going through ``copy.copy``'s reduce protocol.
+    Like ``copy.copy``, skips ``__init__``/``__post_init__`` and shares field values.
+    """
+    new_pv = PV.__new__(PV)
+    new_pv.__dict__.update(pv.__dict__)
+    return new_pv
+
+
 class Client:
     backend: _Backend
     cl: ControlLayer
@@ -32,11 +116,13 @@ class Client:
             logger.warning('No backend specified, loading an empty test backend')
             backend = get_backend('test')()
         if control_layer is None:
+            from squirrel.control_layer import ControlLayer
             control_layer = ControlLayer()
 
         self.backend = backend
         self.cl = control_layer
-        self.meta_pvs = meta_pvs or []
+        # resolved once here; views read this on every fetch and header paint
+        self.meta_pvs = tuple(meta_pvs or ())
 
     @classmethod
     def from_config(cls, cfg: Optional[Path] = None):
@@ -75,12 +161,10 @@ class Client:
         """
         if not cfg:
             cfg = cls.find_config()
-        if not os.path.exists(cfg):
+        try:
+            cfg_parser = _read_config(cfg)
+        except FileNotFoundError:
             raise RuntimeError(f"Superscore configuration file not found: {cfg}")
-
-        cfg_parser = configparser.ConfigParser()
-        cfg_parser.read(cfg)
-        logger.debug(f"Loading configuration file at ({cfg})")
         return cls.from_parsed_config(cfg_parser, cfg)
 
     @classmethod
@@ -91,11 +175,9 @@ class Client:
         Client initialization.
         """
         # Gather Backend
-        if 'backend' in cfg_parser.sections():
-            backend_type = cfg_parser.get("backend", "type")
-            kwargs = {key: value for key, value
-                      in cfg_parser["backend"].items()
-                      if key != "type"}
+        if cfg_parser.has_section('backend'):
+            kwargs = dict(cfg_parser["backend"].items())
+            backend_type = kwargs.pop("type")
             backend_class = get_backend(backend_type)
             if 'path' in kwargs:
                 kwargs['path'] = build_abs_path(Path(cfg_path).parent, kwargs['path'])
@@ -105,25 +187,29 @@ class Client:
             backend = get_backend('test')()
 
         # configure control layer and shims
-        if 'control_layer' in cfg_parser.sections():
-            shim_choices = [val for val, enabled
-                            in cfg_parser["control_layer"].items()
-                            if enabled]
+        from squirrel.control_layer import ControlLayer
+        if cfg_parser.has_section('control_layer'):
+            # values are strings, so "false" must be parsed rather than tested for truth
+            shims = cfg_parser["control_layer"]
+            shim_choices = [shim for shim in shims if shims.getboolean(shim, fallback=False)]
             control_layer = ControlLayer(shims=shim_choices)
         else:
             logger.debug('No control layer shims specified, loading all available')
             control_layer = ControlLayer()
 
-        if 'meta PVs' in cfg_parser.sections():
+        meta_pvs = []
+        if cfg_parser.has_section('meta PVs'):
             pv_strs = cfg_parser['meta PVs']['pvs'].split('\n')
-            meta_pvs = []
+            # Resolve all meta PVs with one backend search rather than one per PV
+            matches = {string: [] for string in pv_strs}
+            for pv in backend.search(
+                ('entry_type', 'eq', PV),
+                ('readback', 'in', tuple(matches)),
+            ):
+                matches[pv.readback].append(pv)
             for string in pv_strs:
-                pv = list(backend.search(
-                    ('entry_type', 'eq', PV),
-                    ('readback', 'eq', string)),
-                )
-                if len(pv) == 1:
-                    meta_pvs.append(pv[0])
+                if len(matches[string]) == 1:
+                    meta_pvs.append(matches[string][0])
                 else:
                     logger.warning(f"Could not fetch meta PV {string} from backend")
 
@@ -148,30 +234,12 @@ class Client:
         OSError
             If no configuration file can be found by the described methodology
         """
-        # Point to with an environment variable
-        if os.environ.get('SQUIRREL_CFG', False):
-            squirrel_cfg = os.environ.get('SQUIRREL_CFG')
-            logger.debug("Found $SQUIRREL_CFG specification for Client "
-                         "configuration at %s", squirrel_cfg)
-            return squirrel_cfg
-        # Search in the current directory and home directory
-        else:
-            config_dirs = [os.environ.get('XDG_CONFIG_HOME', "."),
-                           os.path.expanduser('~/.config'),]
-            for directory in config_dirs:
-                logger.debug('Searching for squirrel config in %s', directory)
-                for path in ('.squirrel.cfg', 'squirrel.cfg'):
-                    full_path = os.path.join(directory, path)
-
-                    if os.path.exists(full_path):
-                        logger.debug("Found configuration file at %r", full_path)
-                        return full_path
-        # If found nothing
-        default_config = os.path.join(os.path.dirname(__file__), "tests/demo.cfg")
-        if os.path.isfile(default_config):
-            return default_config
-        else:
-            raise OSError("No squirrel configuration file found")
+        # Discovery only depends on these, so repeated lookups hit the cache
+        return _find_config(
+            os.environ.get('SQUIRREL_CFG', ''),
+            os.environ.get('XDG_CONFIG_HOME', "."),
+            os.path.expanduser('~/.config'),
+        )
 
     def search(self, *post: SearchTermType) -> Generator[Entry, None, None]:
         """
@@ -180,19 +248,22 @@ class Client:
         Some operators are supported in the UI / client and must be converted before being
         passed to the backend.
         """
-        new_search_terms = []
-        for search_term in post:
-            if not isinstance(search_term, SearchTerm):
-                search_term = SearchTerm(*search_term)
-            if search_term.operator == 'isclose':
-                target, rel_tol, abs_tol = search_term.value
+        return self.backend.search(*self._rewrite_search_terms(post))
+
+    @staticmethod
+    def _rewrite_search_terms(
+        search_terms: Iterable[SearchTermType]
+    ) -> Generator[SearchTermType, None, None]:
+        """Yield ``search_terms``, converting client-only operators to backend ones"""
+        for search_term in search_terms:
+            # backends unpack terms positionally, so plain tuples pass through as-is
+            if search_term[1] == 'isclose':
+                attr, _, (target, rel_tol, abs_tol) = search_term
                 lower = target - target * rel_tol - abs_tol
                 upper = target + target * rel_tol + abs_tol
-                new_search_terms.append(SearchTerm(search_term.attr, 'gt', lower))
-                new_search_terms.append(SearchTerm(search_term.attr, 'lt', upper))
+                yield SearchTerm(attr, 'between', (lower, upper))
             else:
-                new_search_terms.append(search_term)
-        return self.backend.search(*new_search_terms)
+                yield search_term
 
     def save(self, entry: Entry):
         """Save information in ``entry`` to database"""
@@ -220,22 +291,24 @@ class Client:
         """
         logger.debug("Saving Snapshot")
         pvs = self.backend.get_all_pvs()
-        all_addresses = [pv.setpoint for pv in pvs if pv.setpoint] + [pv.readback for pv in pvs if pv.readback]
+        # Request each address once, even if several PVs share it
+        all_addresses = list(dict.fromkeys(
+            address for pv in pvs for address in (pv.setpoint, pv.readback) if address
+        ))
         values = self.cl.get(all_addresses)
-        data = {pv_address: value for pv_address, value in zip(all_addresses, values)}
+        # raw values are normalized per field, so failed reads at a shared
+        # address don't share one mutable default EpicsData
+        data = dict(zip(all_addresses, values))
+        value_or_default = self._value_or_default
 
         snapshot = dest or Snapshot()
 
         for pv in pvs:
-            new_entry = copy.copy(pv)
+            new_entry = _copy_pv(pv)
             if pv.readback:
-                value = data[pv.readback]
-                edata = self._value_or_default(value)
-                new_entry.readback_data = edata
+                new_entry.readback_data = value_or_default(data[pv.readback])
             if pv.setpoint:
-                value = data[pv.setpoint]
-                edata = self._value_or_default(value)
-                new_entry.setpoint_data = edata
+                new_entry.setpoint_data = value_or_default(data[pv.setpoint])
             snapshot.pvs.append(new_entry)
 
         return snapshot
@@ -285,12 +358,16 @@ class Client:
                 status_list.append(status)
             return status_list
         else:
-            address_list = [pv.setpoint for pv in setpoints]
-            value_list = [pv.setpoint_data.data for pv in setpoints]
+            address_list = []
+            value_list = []
+            for pv in setpoints:
+                address_list.append(pv.setpoint)
+                value_list.append(pv.setpoint_data.data)
             return self.cl.put(address_list, value_list)
 
-    def _value_or_default(self, value: Any) -> EpicsData:
+    @staticmethod
+    def _value_or_default(value: Any) -> EpicsData:
         """small helper for ensuring value is an EpicsData instance"""
-        if value is None or not isinstance(value, EpicsData):
-            return EpicsData(data=None)
-        return value
+        if isinstance(value, EpicsData):
+            return value
+        return EpicsData(data=None)
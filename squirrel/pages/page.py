@@ -14,7 +14,14 @@ class Page(QtWidgets.QWidget):
         super().__init__(parent)
         self.pv_table_models: dict[UUID: PVTableModel] = {}
 
+    def stop_polling(self) -> None:
+        """Ask every model's poll thread to stop without waiting for it to finish"""
+        for model in self.pv_table_models.values():
+            model.stop_polling()
+
     def closeEvent(self, a0: QCloseEvent) -> None:
+        # Stop all threads first so that the waits in close() overlap instead of adding up
+        self.stop_polling()
         for model in self.pv_table_models.values():
             try:
                 model.close()
@@ -74,7 +74,7 @@ class PVBrowserPage(Page):
         self.pv_browser_table.setModel(self.pv_browser_filter)
         self.pv_browser_table.setItemDelegateForColumn(
             PV_BROWSER_HEADER.TAGS.value,
-            TagDelegate(self.client.backend.get_tags())
+            TagDelegate(self.client.backend.get_tags(), self.pv_browser_table)
         )
         header_view = self.pv_browser_table.horizontalHeader()
         header_view.setSectionResizeMode(header_view.ResizeMode.Fixed)
@@ -268,6 +268,9 @@ class TagPage(QWidget):
     manage the tags within each group.
     """
 
+    # Emitted after tag groups have been changed in the backend
+    tagGroupsChanged = Signal()
+
     def __init__(self, client) -> None:
         """
         Initialize the tag groups window.
@@ -452,6 +455,7 @@ class TagPage(QWidget):
                 del self.groups_data[group]
                 del self.index_to_tag_group[row]
                 self.table.removeRow(row)
+                self.tagGroupsChanged.emit()
                 return True
         return False
 
@@ -480,6 +484,7 @@ class TagPage(QWidget):
         description = "New group description"
 
         group_id = self.client.backend.add_tag_group(group_name, description)
+        self.tagGroupsChanged.emit()
         group_desc = description
         self.groups_data[group_id] = [group_name, group_desc, {}]
         self.index_to_tag_group.append(group_id)
@@ -836,7 +841,11 @@ class TagPage(QWidget):
                     self.client.backend.update_tag_in_group(group, tag, name)
         except Exception as e:
             logger.exception(e)
+            # Some of the changes may have been saved before the failure
+            self.tagGroupsChanged.emit()
         else:
+            self.tagGroupsChanged.emit()
+
             tag_chip = self.table.cellWidget(row, 0)
             tag_chip.tag_name = new_name
 
@@ -8,15 +8,33 @@ from __future__ import annotations
 
 import logging
 from collections.abc import Sequence
+from functools import cache
 from typing import (Any, ClassVar, Dict, List, Optional, Set, Type, Union,
                     get_args, get_origin, get_type_hints)
 
+import qtawesome as qta
 from qtpy.QtCore import QObject
 from qtpy.QtCore import Signal as QSignal
+from qtpy.QtGui import QIcon
 
 logger = logging.getLogger(__name__)
 
 
+@cache
+def cached_icon(name: str, **options: Any) -> QIcon:
+    """
+    Build a qtawesome icon once per name and options, and reuse it on later
+    calls.  Option values must be hashable, e.g. ``color="#888"``.
+    """
+    return qta.icon(name, **options)
+
+
+@cache
+def _get_field_hints(data_type: type) -> Dict[str, Any]:
+    """Resolve the type hints of a dataclass once, shared by all of its bridges"""
+    return get_type_hints(data_type)
+
+
 class QDataclassBridge(QObject):
     """
     Convenience structure for managing a dataclass along with qt.
@@ -47,7 +65,7 @@ class QDataclassBridge(QObject):
     def __init__(self, data: Any, parent: Optional[QObject] = None):
         super().__init__(parent=parent)
         self.data = data
-        fields = get_type_hints(type(data))
+        fields = _get_field_hints(type(data))
         for name, type_hint in fields.items():
             self.set_field_from_data(name, type_hint, data)
 
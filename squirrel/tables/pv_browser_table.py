@@ -2,10 +2,10 @@ import logging
 from enum import Enum, auto
 from typing import Any, Dict, Iterable, List
 
-import qtawesome as qta
 from qtpy import QtCore
 
 from squirrel.model import PV
+from squirrel.qt_helpers import cached_icon
 from squirrel.type_hints import TagSet
 
 logger = logging.getLogger(__name__)
@@ -87,7 +87,7 @@ class PVBrowserTableModel(QtCore.QAbstractTableModel):
                 return entry.tags if entry.tags else {}
         elif role == QtCore.Qt.DecorationRole:
             if column == PV_BROWSER_HEADER.DELETE:
-                return qta.icon("msc.trash")
+                return cached_icon("msc.trash")
         elif role == QtCore.Qt.UserRole:
             # Return the full entry object for further processing
             entry = self._data[index.row()]
@@ -122,12 +122,13 @@ class PVBrowserTableModel(QtCore.QAbstractTableModel):
     def refetch_row(self, row):
         index = self.index(row, PV_BROWSER_HEADER.PV.value)
         pv_id = self.data(index, QtCore.Qt.UserRole).uuid
-        pv = list(
+        # stop at the first match instead of scanning the rest of the backend
+        pv = next(
             self.client.search(
                 ("entry_type", "eq", PV),
                 ("uuid", "eq", pv_id),
             )
-        )[0]
+        )
         self._data[row] = pv
         self.dataChanged.emit(index, index)
 
@@ -40,6 +40,9 @@ PV_HEADER._strings = {
     PV_HEADER.CONFIG: "CON",
 }
 
+# Column lookup by index, cheaper than PV_HEADER(value) on every data() call
+_COLUMNS = tuple(PV_HEADER)
+
 
 class PVTableModel(LivePVTableModel):
     """
@@ -57,9 +60,13 @@ class PVTableModel(LivePVTableModel):
         if snapshot:
             self.set_snapshot(snapshot)
         else:
-            self._data = []
             self._checked = set()
 
+    @property
+    def _data(self) -> list[PV]:
+        """The PVs shown in the table, resolved by LivePVTableModel.set_entries"""
+        return self.entries
+
     def rowCount(self, parent=None):
         return len(self._data)
 
@@ -96,7 +103,7 @@ class PVTableModel(LivePVTableModel):
         role: QtCore.Qt.ItemDataRole = QtCore.Qt.DisplayRole
     ):
         entry = self._data[index.row()]
-        column = PV_HEADER(index.column())
+        column = _COLUMNS[index.column()]
         if role == QtCore.Qt.DisplayRole:
             if column == PV_HEADER.CHECKBOX:
                 pass
@@ -155,9 +162,14 @@ class PVTableModel(LivePVTableModel):
                     return font
             return None
         elif role == QtCore.Qt.TextAlignmentRole:
-            if column not in [PV_HEADER.DEVICE, PV_HEADER.PV] or index.data() != NO_DATA:
+            # mirror the DisplayRole text without dispatching back through data()
+            if column == PV_HEADER.DEVICE:
+                text = entry.device or NO_DATA
+            elif column == PV_HEADER.PV:
+                text = entry.setpoint
+            else:
                 return None
-            return QtCore.Qt.AlignCenter
+            return QtCore.Qt.AlignCenter if text == NO_DATA else None
         elif role == QtCore.Qt.UserRole:
             return entry
         return None
@@ -190,16 +202,10 @@ class PVTableModel(LivePVTableModel):
                 ("ancestor", "eq", snapshot),
                 ("entry_type", "eq", PV),
             ))
-        finally:
-            self._data = [
-                entry if isinstance(entry, PV) else list(
-                    self.client.search(
-                        ("uuid", "eq", entry)
-                    )
-                )[0] for entry in entries
-            ]
         self._checked = set()
-        self.set_entries(self._data)
+        # copied so row removal doesn't modify the snapshot; any bare ids are
+        # resolved by set_entries
+        self.set_entries(list(entries))
 
     def get_selected_pvs(self) -> Iterable[PV]:
         """Return the Setpoints corresponding to checked rows in the table"""
@@ -1,13 +1,21 @@
+import datetime
 import logging
 import operator
+from bisect import bisect_left, bisect_right
+from functools import partial
+from typing import Optional
 
 from qtpy import QtCore
 
 from squirrel.errors import BackendError
-from squirrel.model import Snapshot
+from squirrel.model import PV, Snapshot
 
 logger = logging.getLogger(__file__)
 
+# Roles compared on every data() call, bound once instead of looked up through QtCore.Qt
+_DISPLAY_ROLE = QtCore.Qt.DisplayRole
+_TOOLTIP_ROLE = QtCore.Qt.ToolTipRole
+
 
 class SnapshotTableModel(QtCore.QAbstractTableModel):
     """A table model containing all of the Snapshots available in a client"""
@@ -16,45 +24,53 @@ class SnapshotTableModel(QtCore.QAbstractTableModel):
         "TIMESTAMP",
         "SNAPSHOT TITLE",
     ]
+    HEADER_LEN = len(HEADER)
+
+    _sigSnapshotsLoaded = QtCore.Signal(int, object, object)
 
     def __init__(self, client, parent=None):
         super().__init__(parent)
         self.client = client
         self._data = []
-        self.fetch()
+        # Meta PV columns are captured on fetch, so columnCount stays a plain lookup
+        self._meta_pvs = client.meta_pvs
+        self._column_count = self.HEADER_LEN + len(self._meta_pvs)
+        # Display strings per row, built once in fetch instead of on every paint
+        self._timestamps: list[str] = []
+        self._meta_data: list[list] = []
+        self._meta_tooltips: list[list] = []
+        # Only the most recently started fetch may replace the rows
+        self._fetch_generation = 0
+        self._sigSnapshotsLoaded.connect(self._set_snapshots)
+        # Start empty and fill in once the backend responds, so views can show immediately
+        self.fetch_in_background()
 
     def rowCount(self, parent=None):
         return len(self._data)
 
     def columnCount(self, parent=None):
-        meta_pvs = self.client.meta_pvs
-        return len(self.HEADER) + len(meta_pvs)
+        return self._column_count
 
     def data(
         self,
         index: QtCore.QModelIndex,
         role: QtCore.Qt.ItemDataRole = QtCore.Qt.DisplayRole
     ):
-        column = index.column()
-        if role == QtCore.Qt.DisplayRole:
-            snapshot = self._data[index.row()]
+        # Dispatch on role first; Qt asks for many roles per cell that this model ignores
+        if role == _DISPLAY_ROLE:
+            column = index.column()
             if column == 0:
-                return snapshot.creation_time.astimezone().strftime("%Y-%m-%d %H:%M:%S")
+                return self._timestamps[index.row()]
             elif column == 1:
-                return snapshot.title
-            else:
-                try:
-                    return snapshot.meta_pvs[column - len(self.HEADER)].readback_data.data
-                except IndexError:
-                    return None
-        elif role == QtCore.Qt.ToolTipRole and column >= 2:
-            snapshot = self._data[index.row()]
-            try:
-                return snapshot.meta_pvs[column - len(self.HEADER)].readback
-            except IndexError:
+                return self._data[index.row()].title
+            return self._meta_data[index.row()][column - self.HEADER_LEN]
+        elif role == _TOOLTIP_ROLE:
+            column = index.column()
+            header_len = self.HEADER_LEN
+            if column < header_len:
                 return None
-        else:
-            return None
+            return self._meta_tooltips[index.row()][column - header_len]
+        return None
 
     def headerData(
         self,
@@ -62,24 +78,112 @@ class SnapshotTableModel(QtCore.QAbstractTableModel):
         orientation: QtCore.Qt.Orientation,
         role: QtCore.Qt.ItemDataRole = QtCore.Qt.DisplayRole
     ):
-        if orientation == QtCore.Qt.Horizontal:
-            if role == QtCore.Qt.DisplayRole:
-                try:
-                    return self.HEADER[section]
-                except IndexError:
-                    meta_pvs = self.client.meta_pvs
-                    return meta_pvs[section - len(self.HEADER)].description
+        if role == _DISPLAY_ROLE and orientation == QtCore.Qt.Horizontal:
+            if section < self.HEADER_LEN:
+                return self.HEADER[section]
+            return self._meta_pvs[section - self.HEADER_LEN].description
 
     def fetch(self):
         """Fetch all snapshots from the backend"""
-        self.beginResetModel()
-        self._data = sorted(
-            self.client.backend.get_snapshots(meta_pvs=self.client.meta_pvs),
-            key=lambda s: s.creation_time,
+        self._fetch_generation += 1
+        meta_pvs = self.client.meta_pvs
+        self._set_snapshots(self._fetch_generation, meta_pvs, self._load_snapshots(meta_pvs))
+
+    def fetch_in_background(self) -> None:
+        """
+        Fetch all snapshots from the backend on the global thread pool. The model keeps
+        its current rows until the fetched snapshots arrive.
+        """
+        self._fetch_generation += 1
+        QtCore.QThreadPool.globalInstance().start(
+            partial(self._fetch_task, self._fetch_generation, self.client.meta_pvs)
+        )
+
+    def _fetch_task(self, generation: int, meta_pvs: tuple[PV, ...]) -> None:
+        """Runs on a worker thread, loaded rows are handed to the GUI thread by signal"""
+        try:
+            loaded = self._load_snapshots(meta_pvs)
+        except BackendError as e:
+            logger.exception(e)
+            return
+        try:
+            self._sigSnapshotsLoaded.emit(generation, meta_pvs, loaded)
+        except RuntimeError:
+            # model was deleted before the fetch finished
+            pass
+
+    def _load_snapshots(self, meta_pvs: tuple[PV, ...]) -> tuple[list, list, list, list]:
+        """Get the sorted snapshots and build their display values, without touching the model"""
+        snapshots = sorted(
+            self.client.backend.get_snapshots(meta_pvs=meta_pvs),
+            key=operator.attrgetter("creation_time"),
             reverse=True,
         )
+        # Same text as strftime("%Y-%m-%d %H:%M:%S"), without parsing a format string per row
+        timestamps = [
+            snapshot.creation_time.astimezone().replace(tzinfo=None).isoformat(sep=" ", timespec="seconds")
+            for snapshot in snapshots
+        ]
+        # Rows are padded to one entry per meta PV column, so data() can index them directly
+        n_meta = len(meta_pvs)
+        padding = [None] * n_meta
+        meta_data = []
+        meta_tooltips = []
+        for snapshot in snapshots:
+            row_pvs = snapshot.meta_pvs[:n_meta]
+            meta_data.append([pv.readback_data.data for pv in row_pvs] + padding[len(row_pvs):])
+            meta_tooltips.append([pv.readback for pv in row_pvs] + padding[len(row_pvs):])
+        return snapshots, timestamps, meta_data, meta_tooltips
+
+    @QtCore.Slot(int, object, object)
+    def _set_snapshots(self, generation: int, meta_pvs: tuple[PV, ...], loaded: tuple) -> None:
+        if generation != self._fetch_generation:
+            # a newer fetch has been started since this one
+            return
+        if meta_pvs == self._meta_pvs and self._update_rows(loaded):
+            return
+        self.beginResetModel()
+        self._meta_pvs = meta_pvs
+        self._column_count = self.HEADER_LEN + len(meta_pvs)
+        self._data, self._timestamps, self._meta_data, self._meta_tooltips = loaded
         self.endResetModel()
 
+    def _update_rows(self, loaded: tuple) -> bool:
+        """
+        Apply a refetch as row insertions and per-row dataChanged, which keeps the view's
+        selection and scroll position. New snapshots sort to the top, so this handles the
+        usual refresh. Returns False if the rows changed in some other way and the model
+        should be reset instead.
+        """
+        snapshots, timestamps, meta_data, meta_tooltips = loaded
+        n_new = len(snapshots) - len(self._data)
+        if not self._data or n_new < 0:
+            return False
+        if [s.uuid for s in snapshots[n_new:]] != [s.uuid for s in self._data]:
+            return False
+
+        changed = [
+            row for row, snapshot in enumerate(self._data)
+            if (
+                snapshot.title != snapshots[row + n_new].title
+                or self._timestamps[row] != timestamps[row + n_new]
+                or self._meta_data[row] != meta_data[row + n_new]
+                or self._meta_tooltips[row] != meta_tooltips[row + n_new]
+            )
+        ]
+        if len(changed) > len(self._data) // 2:
+            return False
+
+        if n_new:
+            self.beginInsertRows(QtCore.QModelIndex(), 0, n_new - 1)
+        self._data, self._timestamps, self._meta_data, self._meta_tooltips = loaded
+        if n_new:
+            self.endInsertRows()
+        last_column = self._column_count - 1
+        for row in changed:
+            self.dataChanged.emit(self.index(row + n_new, 0), self.index(row + n_new, last_column))
+        return True
+
     def index_to_snapshot(self, index: QtCore.QModelIndex) -> Snapshot:
         """Convert a QModelIndex to a Snapshot object."""
         if not (index and index.isValid()):
@@ -109,35 +213,126 @@ class SnapshotFilterModel(QtCore.QSortFilterProxyModel):
         self.setFilterKeyColumn(1)
         self.since = QtCore.QDate.currentDate().addYears(-1)
         self.until = QtCore.QDate.currentDate()
+        # Bounds as day ordinals, comparable with datetime.toordinal() of creation times
+        self._since_day = self._to_ordinal(self.since)
+        self._until_day = self._to_ordinal(self.until)
         self.filters = []  # List that contains: [{column, operator, value}]
+        self._compiled_filters = []  # List that contains: [(column, comparison, numeric value, str value)]
+        # Per-row result of the meta pv filters, and the source rows it was computed for
+        self._meta_filter_mask: Optional[list[bool]] = None
+        self._meta_filter_rows = None
+        # Negated creation date ordinals of the source rows (ascending, since the source is
+        # sorted newest first), and the [start, stop) rows falling inside the date range
+        self._date_keys: list[int] = []
+        self._date_key_rows = None
+        self._date_rows: Optional[tuple[int, int]] = None
+        self._date_rows_stale = True
+        # Row ranges of previously applied date ranges, keyed by their day ordinals
+        self._date_rows_cache: dict[tuple[int, int], Optional[tuple[int, int]]] = {}
+        # Title filter set via setFilterFixedString, matched directly against Snapshot.title.
+        # None when a regular expression was set instead, which Qt's filtering handles
+        self._title_filter: Optional[str] = ""
+        self._has_regex_filter = False
+        self._title_needle = ""
+        self._title_casefold = False
+        # Casefolded titles of the source rows, for case insensitive title filtering
+        self._folded_titles: list[str] = []
+        self._folded_title_rows = None
+
+    @staticmethod
+    def _to_ordinal(qdate: QtCore.QDate) -> int:
+        return datetime.date(qdate.year(), qdate.month(), qdate.day()).toordinal()
 
     def filterAcceptsRow(self, row: int, parent: QtCore.QModelIndex) -> bool:
-        datetime = self.sourceModel()._data[row].creation_time
-        date = QtCore.QDate(datetime.year, datetime.month, datetime.day)
-        is_date_in_range = self.since <= date and date <= self.until
+        date_rows = self._get_date_rows()
+        if date_rows is not None and not date_rows[0] <= row < date_rows[1]:
+            return False
 
-        if not is_date_in_range:
+        if self._compiled_filters and not self._get_meta_filter_mask()[row]:
             return False
 
-        # Meta PV filtering
-        snapshot = self.sourceModel()._data[row]
-        for meta_pv_filter in self.filters:
-            column_name = meta_pv_filter["column"]
-            input_operator = meta_pv_filter["operator"]
-            input_value = meta_pv_filter["value"]
+        if self._title_filter is None:
+            if not self._has_regex_filter:
+                return True
+            return super().filterAcceptsRow(row, parent)
+        elif not self._title_needle:
+            return True
+        elif self._title_casefold:
+            return self._title_needle in self._get_folded_titles()[row]
+        return self._title_needle in self.sourceModel()._data[row].title
 
-            comparison_function = self.SUPPORTED_OPERATORS.get(input_operator)
+    def _get_folded_titles(self) -> list[str]:
+        """Return the casefolded title of each source row, folded once per set of rows"""
+        rows = self.sourceModel()._data
+        if self._folded_title_rows is not rows:
+            self._folded_titles = [snapshot.title.casefold() for snapshot in rows]
+            self._folded_title_rows = rows
+        return self._folded_titles
 
-            # Retrieve the data for the corresponding meta_pv
-            matching_pv = [pv for pv in snapshot.meta_pvs if pv.description == column_name][0]
-            epics_data = matching_pv.readback_data or matching_pv.setpoint_data
+    def _get_date_rows(self) -> Optional[tuple[int, int]]:
+        """
+        Return the [start, stop) source rows created within the date range, or None if
+        the range covers every row and no row needs checking. The source model keeps its
+        rows sorted newest first, so the range is found by bisection instead of comparing
+        every row's date.
+        """
+        rows = self.sourceModel()._data
+        if self._date_key_rows is not rows:
+            self._date_keys = [-snapshot.creation_time.toordinal() for snapshot in rows]
+            self._date_key_rows = rows
+            self._date_rows_stale = True
+            self._date_rows_cache.clear()
+        if self._date_rows_stale:
+            since, until = self._since_day, self._until_day
+            key = (since, until)
+            if key in self._date_rows_cache:
+                date_rows = self._date_rows_cache[key]
+            else:
+                if len(self._date_rows_cache) >= 32:
+                    self._date_rows_cache.clear()
+                date_rows = (
+                    bisect_left(self._date_keys, -until),
+                    bisect_right(self._date_keys, -since),
+                )
+                if date_rows == (0, len(rows)):
+                    date_rows = None
+                self._date_rows_cache[key] = date_rows
+            self._date_rows = date_rows
+            self._date_rows_stale = False
+        return self._date_rows
 
-            try:
-                pv_value = float(epics_data.data)
-                input_value = float(input_value)
-            except (ValueError, TypeError):
+    def _get_meta_filter_mask(self) -> list[bool]:
+        """
+        Return whether each source row passes the meta pv filters. The mask is built in one
+        pass when the filters or the source rows change, so re-filtering on title or date
+        does not evaluate the meta pv filters again.
+        """
+        rows = self.sourceModel()._data
+        if self._meta_filter_rows is not rows:
+            self._meta_filter_mask = [self._meta_filters_accept(snapshot) for snapshot in rows]
+            self._meta_filter_rows = rows
+        return self._meta_filter_mask
+
+    def _meta_filters_accept(self, snapshot: Snapshot) -> bool:
+        meta_data = {
+            pv.description: pv.readback_data or pv.setpoint_data
+            for pv in reversed(snapshot.meta_pvs)
+        }
+        for column_name, comparison_function, numeric_value, str_value in self._compiled_filters:
+            if column_name not in meta_data:
+                return False
+            epics_data = meta_data[column_name]
+
+            pv_value = None
+            if numeric_value is not None:
+                try:
+                    pv_value = float(epics_data.data)
+                    input_value = numeric_value
+                except (ValueError, TypeError):
+                    pass
+            if pv_value is None:
                 pv_value = str(epics_data.data)
-                input_value = str(input_value)
+                input_value = str_value
 
             try:
                 if not comparison_function(pv_value, input_value):
@@ -145,15 +340,62 @@ class SnapshotFilterModel(QtCore.QSortFilterProxyModel):
             except Exception as e:
                 print(f'Exception applying filter: {e}')
                 return False
+        return True
+
+    def setFilterFixedString(self, pattern: str) -> None:
+        """Filter snapshot titles by substring, without going through the source model's data()"""
+        self._title_filter = pattern
+        self._update_title_needle()
+        super().setFilterFixedString(pattern)
+
+    def setFilterRegularExpression(self, pattern) -> None:
+        """Hand title filtering back to Qt, which is skipped entirely for an empty pattern"""
+        self._title_filter = None
+        super().setFilterRegularExpression(pattern)
+        self._has_regex_filter = bool(self.filterRegularExpression().pattern())
 
-        return super().filterAcceptsRow(row, parent)
+    def setFilterCaseSensitivity(self, cs: QtCore.Qt.CaseSensitivity) -> None:
+        super().setFilterCaseSensitivity(cs)
+        self._update_title_needle()
+
+    def _update_title_needle(self) -> None:
+        self._title_casefold = self.filterCaseSensitivity() == QtCore.Qt.CaseInsensitive
+        if self._title_filter is None:
+            return
+        if self._title_casefold:
+            self._title_needle = self._title_filter.casefold()
+        else:
+            self._title_needle = self._title_filter
 
     def setDateRange(self, since: QtCore.QDate, until: QtCore.QDate):
+        # Both bounds are whole days, so an unchanged pair cannot change the result
+        if since == self.since and until == self.until:
+            return
         self.since = since
         self.until = until
-        self.invalidateFilter()
+        self._since_day = self._to_ordinal(since)
+        self._until_day = self._to_ordinal(until)
+        self._date_rows_stale = True
+        self.invalidateRowsFilter()
 
     def setMetaPVFilters(self, filters: list[dict]) -> None:
-        """Set the filters that will be applied to the meta pv columns"""
+        """
+        Set the filters that will be applied to the meta pv columns. Each filter's operator
+        and value are parsed here once, rather than for every row that is filtered.
+        """
         self.filters = filters
-        self.invalidateFilter()
+        self._compiled_filters = []
+        for meta_pv_filter in filters:
+            input_value = meta_pv_filter["value"]
+            try:
+                numeric_value = float(input_value)
+            except (ValueError, TypeError):
+                numeric_value = None
+            self._compiled_filters.append((
+                meta_pv_filter["column"],
+                self.SUPPORTED_OPERATORS.get(meta_pv_filter["operator"]),
+                numeric_value,
+                str(input_value),
+            ))
+        self._meta_filter_rows = None
+        self.invalidateRowsFilter()
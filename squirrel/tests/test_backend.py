@@ -1,3 +1,5 @@
+from datetime import timedelta
+
 import pytest
 
 from squirrel.backends import SearchTerm, TestBackend, _Backend
@@ -97,6 +99,24 @@ def test_fuzzy_search(test_backend: _Backend):
     assert len(results) == 2
 
 
+@setup_test_stack(
+    sources=["sample_database"], backend_type=[TestBackend]
+)
+def test_range_search(test_backend: _Backend):
+    snapshot = next(test_backend.search(SearchTerm('entry_type', 'eq', Snapshot)))
+    created = snapshot.creation_time
+    results = list(test_backend.search(
+        SearchTerm('entry_type', 'eq', Snapshot),
+        SearchTerm('creation_time', 'between', (created - timedelta(seconds=1), created)),
+    ))
+    assert snapshot in results
+
+    results = list(test_backend.search(
+        SearchTerm('creation_time', 'between', (created + timedelta(days=1), created + timedelta(days=2))),
+    ))
+    assert results == []
+
+
 @setup_test_stack(
     sources=["sample_database"], backend_type=[TestBackend]
 )
@@ -1,11 +1,16 @@
+import configparser
 import os
+import typing
 from pathlib import Path
-from unittest.mock import patch
+from typing import Iterable, Optional
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+import squirrel.client
 from squirrel.backends import MongoBackend, SearchTerm, TestBackend
-from squirrel.client import Client
+from squirrel.client import Client, _read_config
+from squirrel.control_layer import ControlLayer, TaskStatus
 from squirrel.errors import CommunicationError
 from squirrel.model import PV, EpicsData
 from squirrel.tests.conftest import MockTaskStatus, setup_test_stack
@@ -117,6 +122,29 @@ def test_snap_exception(get_mock, test_client: Client, sample_database_fixture:
     assert snapshot.pvs[2].setpoint_data.data is None
 
 
+def test_snap_shared_addresses():
+    backend = TestBackend(pvs=[
+        PV(setpoint="SHARED", readback="RBV"),
+        PV(readback="SHARED"),
+    ])
+    control_layer = MagicMock()
+    control_layer.get.side_effect = lambda addresses: [EpicsData(address) for address in addresses]
+    client = Client(backend=backend, control_layer=control_layer)
+
+    snapshot = client.snap()
+    assert control_layer.get.call_args[0][0] == ["SHARED", "RBV"]
+    assert snapshot.pvs[0].setpoint_data.data == "SHARED"
+    assert snapshot.pvs[0].readback_data.data == "RBV"
+    assert snapshot.pvs[1].readback_data.data == "SHARED"
+
+    # a failed read at a shared address gives each PV its own default
+    control_layer.get.side_effect = lambda addresses: [CommunicationError(address) for address in addresses]
+    snapshot = client.snap()
+    assert snapshot.pvs[0].setpoint_data.data is None
+    assert snapshot.pvs[1].readback_data.data is None
+    assert snapshot.pvs[0].setpoint_data is not snapshot.pvs[1].readback_data
+
+
 @pytest.mark.skip(reason="Mongo backend not reachable from GitHub action")
 def test_from_cfg(sscore_cfg: str):
     client = Client.from_config()
@@ -124,6 +152,55 @@ def test_from_cfg(sscore_cfg: str):
     assert 'ca' in client.cl.shims
 
 
+def test_from_parsed_config_meta_pvs():
+    backend = TestBackend(pvs=[
+        PV(readback="META:A"),
+        PV(readback="META:B"),
+        PV(readback="OTHER"),
+    ])
+    backend.search = MagicMock(wraps=backend.search)
+    cfg_parser = configparser.ConfigParser()
+    cfg_parser.read_string(
+        "[backend]\ntype = test\n"
+        "[control_layer]\nca = true\n"
+        "[meta PVs]\npvs = META:B\n    META:MISSING\n    META:A\n"
+    )
+
+    with patch("squirrel.client.get_backend", return_value=lambda: backend):
+        client = Client.from_parsed_config(cfg_parser)
+
+    assert [pv.readback for pv in client.meta_pvs] == ["META:B", "META:A"]
+    assert backend.search.call_count == 1
+
+
+def test_from_parsed_config_disabled_shims():
+    cfg_parser = configparser.ConfigParser()
+    cfg_parser.read_string(
+        "[backend]\ntype = test\n"
+        "[control_layer]\nca = true\npva = false\n"
+    )
+
+    with patch("squirrel.control_layer.ControlLayer") as control_layer:
+        Client.from_parsed_config(cfg_parser)
+
+    control_layer.assert_called_once_with(shims=["ca"])
+
+
+def test_read_config_reuses_unmodified(tmp_path):
+    cfg_path = tmp_path / "squirrel.cfg"
+    cfg_path.write_text("[backend]\ntype = test\n")
+    first = _read_config(cfg_path)
+    assert _read_config(cfg_path) is first
+
+    cfg_path.write_text("[backend]\ntype = filestore\n")
+    reparsed = _read_config(cfg_path)
+    assert reparsed is not first
+    assert reparsed["backend"]["type"] == "filestore"
+
+    with pytest.raises(RuntimeError):
+        Client.from_config(tmp_path / "missing.cfg")
+
+
 def test_find_config(sscore_cfg: str):
     assert sscore_cfg == Client.find_config()
 
@@ -186,3 +263,12 @@ def test_search_caching(test_client: Client):
 
 def test_parametrized_filestore_empty(test_client: Client):
     assert len(list(test_client.search())) == 0
+
+
+def test_client_type_hints():
+    # annotation names are imported lazily, so resolve them through the module
+    localns = {name: getattr(squirrel.client, name) for name in ("ControlLayer", "TaskStatus")}
+    hints = typing.get_type_hints(Client, localns=localns)
+    assert hints["cl"] is ControlLayer
+    apply_hints = typing.get_type_hints(Client.apply, localns=localns)
+    assert apply_hints["return"] == Optional[Iterable[TaskStatus]]
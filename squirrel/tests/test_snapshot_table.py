@@ -1,10 +1,10 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from unittest.mock import Mock
 
 from qtpy import QtCore
 
-from squirrel.model import PV, EpicsData
-from squirrel.tables import SnapshotFilterModel
+from squirrel.model import PV, EpicsData, Snapshot
+from squirrel.tables import SnapshotFilterModel, SnapshotTableModel
 
 
 def test_meta_pv_numeric_filter():
@@ -65,3 +65,173 @@ def test_meta_pv_numeric_filter():
     ])
     assert filter_model.filterAcceptsRow(0, QtCore.QModelIndex())
     assert filter_model.filterAcceptsRow(1, QtCore.QModelIndex())
+
+    # Refetched source rows are filtered again
+    source_model._data = [snapshot2]
+    filter_model.setMetaPVFilters([
+        {"column": "SXR Pulse Intensity", "operator": "<", "value": "13.0"}
+    ])
+    assert not filter_model.filterAcceptsRow(0, QtCore.QModelIndex())
+    source_model._data = [snapshot1, snapshot2]
+    assert filter_model.filterAcceptsRow(0, QtCore.QModelIndex())
+    assert not filter_model.filterAcceptsRow(1, QtCore.QModelIndex())
+
+
+def test_title_filter():
+    """Verify that title filtering checks the snapshot titles directly"""
+    snapshot1 = Mock()
+    snapshot1.creation_time = datetime(2025, 8, 4)
+    snapshot1.title = "Morning HXR Tune"
+    snapshot1.meta_pvs = []
+
+    snapshot2 = Mock()
+    snapshot2.creation_time = datetime(2025, 8, 4)
+    snapshot2.title = "SXR checkout"
+    snapshot2.meta_pvs = []
+
+    source_model = Mock()
+    source_model._data = [snapshot1, snapshot2]
+
+    filter_model = SnapshotFilterModel()
+    filter_model.sourceModel = lambda: source_model
+    filter_model.setDateRange(
+        QtCore.QDate(2024, 1, 1),
+        QtCore.QDate(2025, 12, 31)
+    )
+    filter_model.setFilterCaseSensitivity(QtCore.Qt.CaseInsensitive)
+
+    filter_model.setFilterFixedString("hxr")
+    assert filter_model.filterAcceptsRow(0, QtCore.QModelIndex())
+    assert not filter_model.filterAcceptsRow(1, QtCore.QModelIndex())
+
+    filter_model.setFilterCaseSensitivity(QtCore.Qt.CaseSensitive)
+    assert not filter_model.filterAcceptsRow(0, QtCore.QModelIndex())
+
+    filter_model.setFilterFixedString("")
+    assert filter_model.filterAcceptsRow(0, QtCore.QModelIndex())
+    assert filter_model.filterAcceptsRow(1, QtCore.QModelIndex())
+
+
+def test_date_filter():
+    """Verify that the date range selects source rows, which are sorted newest first"""
+    snapshots = []
+    for day in (20, 10, 10, 1):
+        snapshot = Mock()
+        snapshot.creation_time = datetime(2025, 8, day, 23, 59)
+        snapshot.meta_pvs = []
+        snapshots.append(snapshot)
+
+    source_model = Mock()
+    source_model._data = snapshots
+
+    filter_model = SnapshotFilterModel()
+    filter_model.sourceModel = lambda: source_model
+
+    filter_model.setDateRange(QtCore.QDate(2025, 8, 2), QtCore.QDate(2025, 8, 10))
+    accepted = [filter_model.filterAcceptsRow(row, QtCore.QModelIndex()) for row in range(4)]
+    assert accepted == [False, True, True, False]
+
+    filter_model.setDateRange(QtCore.QDate(2025, 8, 1), QtCore.QDate(2025, 8, 1))
+    accepted = [filter_model.filterAcceptsRow(row, QtCore.QModelIndex()) for row in range(4)]
+    assert accepted == [False, False, False, True]
+
+    # A range covering every row needs no per-row check
+    filter_model.setDateRange(QtCore.QDate(2025, 1, 1), QtCore.QDate(2025, 12, 31))
+    assert filter_model._get_date_rows() is None
+    assert all(filter_model.filterAcceptsRow(row, QtCore.QModelIndex()) for row in range(4))
+    filter_model.setDateRange(QtCore.QDate(2025, 8, 1), QtCore.QDate(2025, 8, 1))
+
+    # Re-applying the same range is a no-op, and returning to an earlier one reuses its rows
+    filter_model.invalidateRowsFilter = Mock()
+    filter_model.setDateRange(QtCore.QDate(2025, 8, 1), QtCore.QDate(2025, 8, 1))
+    filter_model.invalidateRowsFilter.assert_not_called()
+    filter_model.setDateRange(QtCore.QDate(2025, 8, 2), QtCore.QDate(2025, 8, 10))
+    assert filter_model._get_date_rows() == (1, 3)
+
+    # Refetched source rows are bisected again
+    source_model._data = snapshots[:1]
+    assert not filter_model.filterAcceptsRow(0, QtCore.QModelIndex())
+
+
+def test_meta_pv_columns_follow_fetch(qtbot):
+    client = Mock()
+    client.meta_pvs = (PV(description="HXR Pulse Intensity"),)
+    client.backend.get_snapshots.return_value = []
+    model = SnapshotTableModel(client)
+    assert model.columnCount() == 3
+    assert model.headerData(2, QtCore.Qt.Horizontal) == "HXR Pulse Intensity"
+
+    # Columns only change when the model is refetched
+    client.meta_pvs = ()
+    assert model.columnCount() == 3
+    model.fetch()
+    assert model.columnCount() == 2
+
+
+def test_snapshot_table_display(qtbot):
+    snapshot = Snapshot(
+        title="Morning HXR Tune",
+        creation_time=datetime(2025, 8, 4, 12, tzinfo=timezone.utc),
+        meta_pvs=[PV(readback="HXR:PULSE", readback_data=EpicsData(data=7.5))],
+    )
+    client = Mock()
+    client.meta_pvs = (PV(description="HXR Pulse Intensity"), PV(description="SXR Pulse Intensity"))
+    client.backend.get_snapshots.return_value = [snapshot]
+    model = SnapshotTableModel(client)
+    qtbot.waitUntil(lambda: model.rowCount() == 1)
+
+    timestamp = snapshot.creation_time.astimezone().strftime("%Y-%m-%d %H:%M:%S")
+    assert model.data(model.index(0, 0)) == timestamp
+    assert model.data(model.index(0, 1)) == "Morning HXR Tune"
+    assert model.data(model.index(0, 2)) == 7.5
+    assert model.data(model.index(0, 2), QtCore.Qt.ToolTipRole) == "HXR:PULSE"
+    # Snapshots missing a meta PV leave that column empty
+    assert model.data(model.index(0, 3)) is None
+    assert model.data(model.index(0, 3), QtCore.Qt.ToolTipRole) is None
+
+
+def test_fetch_in_background(qtbot):
+    client = Mock()
+    client.meta_pvs = ()
+    client.backend.get_snapshots.return_value = [Snapshot(title="old")]
+    model = SnapshotTableModel(client)
+    # Construction does not block on the backend
+    assert model.rowCount() == 0
+
+    # A fetch started later wins over the one still in flight
+    client.backend.get_snapshots.return_value = [Snapshot(title="new"), Snapshot(title="newer")]
+    model.fetch()
+    assert model.rowCount() == 2
+    with qtbot.assertNotEmitted(model.modelReset, wait=100):
+        QtCore.QThreadPool.globalInstance().waitForDone()
+    assert model.rowCount() == 2
+
+
+def test_refetch_inserts_new_rows(qtbot):
+    old = Snapshot(uuid="old", title="old", creation_time=datetime(2025, 8, 4, tzinfo=timezone.utc))
+    client = Mock()
+    client.meta_pvs = ()
+    client.backend.get_snapshots.return_value = [old]
+    model = SnapshotTableModel(client)
+    model.fetch()
+
+    new = Snapshot(uuid="new", title="new", creation_time=datetime(2025, 8, 5, tzinfo=timezone.utc))
+    client.backend.get_snapshots.return_value = [old, new]
+    with qtbot.assertNotEmitted(model.modelReset), qtbot.waitSignal(model.rowsInserted) as blocker:
+        model.fetch()
+    assert blocker.args[1:] == [0, 0]
+    assert [model.data(model.index(row, 1)) for row in range(2)] == ["new", "old"]
+
+    # Edited rows are updated in place
+    renamed = Snapshot(uuid="old", title="renamed", creation_time=old.creation_time)
+    client.backend.get_snapshots.return_value = [renamed, new]
+    with qtbot.assertNotEmitted(model.modelReset), qtbot.waitSignal(model.dataChanged) as blocker:
+        model.fetch()
+    assert blocker.args[0].row() == 1
+    assert model.data(model.index(1, 1)) == "renamed"
+
+    # Removed rows fall back to a reset
+    client.backend.get_snapshots.return_value = [new]
+    with qtbot.waitSignal(model.modelReset):
+        model.fetch()
+    assert model.rowCount() == 1
@@ -7,6 +7,7 @@ import pytest
 from pytestqt.qtbot import QtBot
 from qtpy import QtCore, QtWidgets
 
+from squirrel.backends import TestBackend
 from squirrel.client import Client
 from squirrel.model import PV, EpicsData, Severity, Snapshot, Status
 from squirrel.widgets import SquirrelTableView
@@ -73,6 +74,104 @@ def pv_table_view(
     # qtbot.wait_until(lambda: not view.model()._poll_thread.isRunning())
 
 
+def test_pvmodel_editable_cols(test_client: Client, pv_poll_model: LivePVTableModel):
+    other = LivePVTableModel(client=test_client, entries=[])
+    assert other.headers is pv_poll_model.headers
+
+    pv_poll_model.set_editable(LivePVHeader.OPEN, False)
+    assert other._editable_cols[LivePVHeader.OPEN]
+    assert not other._editable_cols[LivePVHeader.PV_NAME]
+
+
+def test_pvmodel_add(pv_poll_model: LivePVTableModel, qtbot: QtBot):
+    pv = PV(setpoint="MY:NEW")
+    with qtbot.assertNotEmitted(pv_poll_model.modelReset), qtbot.waitSignal(pv_poll_model.rowsInserted) as blocker:
+        pv_poll_model.add_entry(pv)
+    assert blocker.args[1:] == [1, 1]
+    assert pv_poll_model.entries[1] is pv
+
+    # entries already in the table are not added again
+    with qtbot.assertNotEmitted(pv_poll_model.rowsInserted):
+        pv_poll_model.add_entry(pv)
+    assert pv_poll_model.rowCount() == 2
+
+    # saved entries are matched by uuid
+    saved = PV(uuid="saved", setpoint="MY:SAVED")
+    pv_poll_model.add_entry(saved)
+    pv_poll_model.add_entry(PV(uuid="saved", setpoint="MY:SAVED", description="edited"))
+    assert pv_poll_model.entries[-1] is saved
+    assert pv_poll_model.rowCount() == 3
+
+    pv_poll_model.remove_entry(saved)
+    pv_poll_model.add_entry(saved)
+    assert pv_poll_model.rowCount() == 3
+
+
+def test_pvmodel_remove(pv_poll_model: LivePVTableModel, simple_snapshot_fixture: Snapshot, qtbot: QtBot):
+    pvs = list(simple_snapshot_fixture.pvs)
+    pv_poll_model.set_entries(list(pvs))
+
+    with qtbot.assertNotEmitted(pv_poll_model.modelReset), qtbot.waitSignal(pv_poll_model.rowsRemoved) as blocker:
+        pv_poll_model.remove_entry(pvs[1])
+    assert blocker.args[1:] == [1, 1]
+    assert pv_poll_model.entries == [pvs[0], pvs[2]]
+    assert pvs[1].setpoint not in pv_poll_model._data_cache
+
+    pv_poll_model.remove_row(0)
+    assert pv_poll_model.entries == [pvs[2]]
+
+    # removing an entry that is not in the table is a no-op
+    pv_poll_model.remove_entry(pvs[0])
+    assert pv_poll_model.entries == [pvs[2]]
+
+
+def test_pvmodel_data_changed_rows(pv_poll_model: LivePVTableModel, qtbot: QtBot):
+    pvs = [
+        PV(setpoint="MY:A", readback="MY:RBV"),
+        PV(setpoint="MY:B"),
+        PV(setpoint="MY:C", readback="MY:RBV"),
+    ]
+    pv_poll_model.set_entries(pvs)
+    changed = []
+    pv_poll_model.dataChanged.connect(lambda top_left, bottom_right: changed.append(
+        (top_left.row(), bottom_right.row(), bottom_right.column())
+    ))
+    last_col = pv_poll_model.columnCount() - 1
+
+    pv_poll_model._data_changed("MY:B")
+    qtbot.wait_until(lambda: bool(changed))
+    assert changed == [(1, 1, last_col)]
+
+    # a burst of updates is coalesced into one signal
+    changed.clear()
+    pv_poll_model._data_changed("MY:RBV")
+    pv_poll_model._data_changed("MY:B")
+    qtbot.wait_until(lambda: bool(changed))
+    qtbot.wait(10)
+    assert changed == [(0, 2, last_col)]
+
+    changed.clear()
+    pv_poll_model.remove_row(0)
+    pv_poll_model._data_changed("MY:C")
+    qtbot.wait_until(lambda: bool(changed))
+    assert changed == [(1, 1, last_col)]
+
+
+def test_pvmodel_resolves_ids():
+    pvs = [PV(uuid="a", setpoint="MY:A"), PV(uuid="b", setpoint="MY:B")]
+    client = Client(backend=TestBackend(pvs=pvs), control_layer=MagicMock())
+    client.backend.search = MagicMock(wraps=client.backend.search)
+
+    model = LivePVTableModel(client=client, entries=["b", pvs[0]])
+    assert [pv.setpoint for pv in model.entries] == ["MY:B", "MY:A"]
+    assert client.backend.search.call_count == 1
+
+    model.set_entries(["a", "b", "a"])
+    assert [pv.setpoint for pv in model.entries] == ["MY:A", "MY:B", "MY:A"]
+    assert client.backend.search.call_count == 2
+    assert set(model._data_cache) == {"MY:A", "MY:B"}
+
+
 @pytest.mark.skip(reason="Test once live table columns are re-implemented")
 def test_pvmodel_polling(pv_poll_model: LivePVTableModel, qtbot: QtBot):
     thread = pv_poll_model._poll_thread
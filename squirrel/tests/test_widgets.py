@@ -7,10 +7,12 @@ from qtpy import QtCore, QtGui
 from squirrel.backends import TestBackend
 from squirrel.client import Client
 from squirrel.color import LIVE_SETPOINT_HIGHLIGHT
-from squirrel.model import EpicsData, Snapshot
+from squirrel.model import PV, EpicsData, Snapshot
 from squirrel.tables import PVTableModel
+from squirrel.tables.pv_table import PV_HEADER
 from squirrel.tests.conftest import setup_test_stack
 from squirrel.widgets import TagsWidget
+from squirrel.widgets.tag import _TagListModel
 
 
 @pytest.fixture(scope='function')
@@ -60,6 +62,7 @@ def test_tags_widget(qtbot):
 
     chip = widget.layout().itemAt(0).widget()
     assert len(chip.tags) == 0
+    assert chip._editor is None  # editor is only built once needed
 
     selection_model = chip.editor.choice_list.selectionModel()
     Select = selection_model.SelectionFlag.Select
@@ -82,11 +85,75 @@ def test_tags_widget(qtbot):
     assert 0 not in chip.tags
     assert 1 not in chip.tags
 
+    # setting tags programmatically syncs the editor's selection
+    chip.set_tags({1})
+    assert chip.editor.get_selected() == {1}
+    assert chip.tags == {1}
+
+    # re-setting identical tags is a no-op
+    with qtbot.assertNotEmitted(chip.tagsChanged):
+        chip.set_tags({1})
+
+
+def test_tags_widget_set_tag_groups(qtbot):
+    tag_groups = {
+        0: ("Dest", "Beam endpoint", {0: "SXR", 1: "HXR"}),
+        1: ("Area", "Accelerator area", {0: "Injector"}),
+    }
+    widget = TagsWidget(tag_groups=tag_groups, enabled=True)
+    qtbot.addWidget(widget)
+    dest_chip = widget.get_group_chip(0)
+    area_chip = widget.get_group_chip(1)
+
+    widget.set_tag_groups({
+        0: ("Dest", "Beam endpoint", {0: "SXR", 1: "HXR"}),
+        1: ("Area", "Accelerator area", {0: "Injector", 1: "Undulator"}),
+    })
+    assert widget.layout().count() == 2
+    assert widget.get_group_chip(0) is dest_chip
+    assert widget.get_group_chip(1) is not area_chip
+    assert widget.get_group_chip(1).choices[1] == "Undulator"
+
+    widget.set_tag_groups({1: ("Area", "Accelerator area", {0: "Injector"})})
+    assert widget.layout().count() == 1
+    assert widget.get_group_chip(0) is None
+
+
+def test_tag_list_model(qtmodeltester):
+    model = _TagListModel()
+    model.set_choices({0: "SXR", 3: "HXR"})
+    assert model.rowCount() == 2
+    assert model.data(model.index(1, 0), QtCore.Qt.UserRole) == 3
+    qtmodeltester.check(model, force_py=True)
+
 
 def test_pv_table_model(qtmodeltester, pv_table_model: PVTableModel):
     qtmodeltester.check(pv_table_model, force_py=True)
 
 
+def test_pv_table_model_resolves_ids(qtbot):
+    pvs = [PV(uuid="a", setpoint="MY:A"), PV(uuid="b", setpoint="MY:B")]
+    client = Client(backend=TestBackend(pvs=pvs), control_layer=MagicMock())
+    client.backend.search = MagicMock(wraps=client.backend.search)
+
+    model = PVTableModel(client, Snapshot(pvs=[pvs[1].uuid, pvs[0], pvs[0].uuid]))
+    assert [pv.setpoint for pv in model._data] == ["MY:B", "MY:A", "MY:A"]
+    assert client.backend.search.call_count == 1
+    model.stop_polling()
+
+
+def test_pv_table_model_alignment(qtbot):
+    pvs = [PV(uuid="a", setpoint="MY:A"), PV(uuid="b", setpoint="MY:B", device="DEV")]
+    client = Client(backend=TestBackend(pvs=pvs), control_layer=MagicMock())
+    model = PVTableModel(client, Snapshot(pvs=pvs))
+
+    align = QtCore.Qt.TextAlignmentRole
+    assert model.data(model.index(0, PV_HEADER.DEVICE.value), align) == QtCore.Qt.AlignCenter
+    assert model.data(model.index(1, PV_HEADER.DEVICE.value), align) is None
+    assert model.data(model.index(0, PV_HEADER.PV.value), align) is None
+    model.stop_polling()
+
+
 @pytest.mark.skip(reason="QThreads aren't behaving with mocked control layer methods")
 @setup_test_stack(sources=["sample_database"], backend_type=TestBackend)
 def test_pv_table_model_data(test_client, pv_table_model: PVTableModel):
@@ -1,11 +1,13 @@
+from unittest.mock import MagicMock
 from uuid import UUID
 
 import pytest
 from pytestqt.qtbot import QtBot
-from qtpy import QtWidgets
+from qtpy import QtGui, QtWidgets
 
 from squirrel.backends import TestBackend
 from squirrel.client import Client
+from squirrel.model import EpicsData
 from squirrel.tables import PVBrowserTableModel
 from squirrel.tests.conftest import setup_test_stack
 from squirrel.widgets.tag import TagsWidget
@@ -141,3 +143,138 @@ def test_nav_panel_selected(qtbot, test_client):
     assert window.navigation_panel.view_snapshots_button.property("selected") is False
     assert window.navigation_panel.browse_pvs_button.property("selected") is True
     assert window.main_content_stack.currentWidget() == window.pv_browser_page
+
+
+@setup_test_stack(sources=["sample_database"], backend_type=TestBackend)
+def test_snapshot_search_debounced(qtbot, test_client):
+    """Passes if the snapshot title filter is applied only once typing pauses"""
+    window = Window(client=test_client)
+    qtbot.addWidget(window)
+
+    proxy_model = window.snapshot_table.model()
+    search_bar = window.view_snapshot_page.findChild(QtWidgets.QLineEdit)
+
+    search_bar.setText("not a snapshot title")
+    search_bar.textEdited.emit(search_bar.text())
+    assert proxy_model.filterRegularExpression().pattern() == ""
+
+    qtbot.waitUntil(lambda: proxy_model.filterRegularExpression().pattern() != "")
+    assert proxy_model.rowCount() == 0
+
+
+@setup_test_stack(sources=["sample_database"], backend_type=TestBackend)
+def test_pages_built_on_demand(qtbot, test_client):
+    """Passes if only the snapshot page is built at startup, and others are built when opened"""
+    window = Window(client=test_client)
+    qtbot.addWidget(window)
+
+    assert window.main_content_stack.count() == 1
+    assert "pv_browser_page" not in window._page_cache
+
+    window.navigation_panel.browse_pvs_button.click()
+    assert window.main_content_stack.count() == 2
+    assert window.main_content_stack.currentWidget() is window._page_cache["pv_browser_page"]
+
+
+@setup_test_stack(sources=["sample_database"], backend_type=TestBackend)
+def test_meta_pv_filter_popup_built_on_demand(qtbot, test_client):
+    """Passes if the meta pv filter popup is only built once the filter button is clicked"""
+    window = Window(client=test_client)
+    qtbot.addWidget(window)
+    assert window.meta_pv_filter_popup is None
+
+    filter_button = next(
+        button for button in window.view_snapshot_page.findChildren(QtWidgets.QPushButton)
+        if button.text().startswith("Filter")
+    )
+    filter_button.click()
+    assert window.meta_pv_filter_popup.isVisible()
+    filter_button.click()
+    assert not window.meta_pv_filter_popup.isVisible()
+
+
+@setup_test_stack(sources=["sample_database"], backend_type=TestBackend)
+def test_pv_details_limits_fetched_async(qtbot, test_client):
+    """Passes if the PV details popup opens first and is filled in once limits are read"""
+    window = Window(client=test_client)
+    qtbot.addWidget(window)
+    test_client.cl.get = MagicMock(return_value=EpicsData(1, lower_alarm_limit=-2.0, upper_alarm_limit=2.0))
+
+    view = window.pv_browser_page.pv_browser_table
+    window.open_pv_details(view.model().index(0, 0), view)
+    popup = window.popup
+    qtbot.addWidget(popup)
+
+    qtbot.waitUntil(lambda: popup.lolo_label.text() == "-2.0")
+    assert popup.hihi_label.text() == "2.0"
+    test_client.cl.get.assert_called_once()
+
+
+@setup_test_stack(sources=["sample_database"], backend_type=TestBackend)
+def test_pv_details_rejects_unknown_model(qtbot, test_client):
+    """Passes if opening PV details from an unsupported model raises TypeError"""
+    window = Window(client=test_client)
+    qtbot.addWidget(window)
+    model = QtGui.QStandardItemModel(1, 1)
+    view = QtWidgets.QTableView()
+    qtbot.addWidget(view)
+    view.setModel(model)
+
+    with pytest.raises(TypeError):
+        window.open_pv_details(model.index(0, 0), view)
+
+
+@setup_test_stack(sources=["sample_database"], backend_type=TestBackend)
+def test_tag_groups_cached_until_edited(qtbot, test_client):
+    """Passes if tag groups are fetched once and fetched again after the tag page edits them"""
+    window = Window(client=test_client)
+    qtbot.addWidget(window)
+
+    tag_groups = window._get_tag_groups()
+    assert window._get_tag_groups() is tag_groups
+
+    window.configure_page  # builds the tag page
+    window.tag_groups_window.add_new_group()
+    assert window._get_tag_groups() is not tag_groups
+    assert len(window._get_tag_groups()) == len(tag_groups) + 1
+
+
+@setup_test_stack(sources=["sample_database"], backend_type=TestBackend)
+def test_take_snapshot_saves_off_ui_thread(qtbot, test_client):
+    """Passes if accepting the snapshot dialog saves and opens the snapshot without blocking"""
+    window = Window(client=test_client)
+    qtbot.addWidget(window)
+    test_client.snap = MagicMock(side_effect=lambda dest: dest)
+    row_count = len(test_client.backend.get_snapshots())
+    qtbot.waitUntil(lambda: window.snapshot_source_model.rowCount() == row_count)
+
+    window.snapshot_source_model.fetch = MagicMock(wraps=window.snapshot_source_model.fetch)
+
+    snapshot = window.take_snapshot()
+    dialog = window.findChild(QtWidgets.QDialog)
+    dialog.accept()
+
+    qtbot.waitUntil(lambda: window.main_content_stack.currentWidget() is window._page_cache.get("snapshot_details_page"))
+    test_client.snap.assert_called_once_with(dest=snapshot)
+    # the snapshot list is refreshed in the background, not with a blocking fetch
+    qtbot.waitUntil(lambda: window.snapshot_source_model.rowCount() == row_count + 1)
+    window.snapshot_source_model.fetch.assert_not_called()
+
+
+@setup_test_stack(sources=["sample_database"], backend_type=TestBackend)
+def test_take_snapshot_reports_failure(qtbot, test_client, monkeypatch):
+    """Passes if a failed snapshot save is reported to the user and no page is opened"""
+    window = Window(client=test_client)
+    qtbot.addWidget(window)
+    test_client.snap = MagicMock(side_effect=RuntimeError("PVs unreachable"))
+    errors = []
+    monkeypatch.setattr(QtWidgets.QMessageBox, "critical", lambda _parent, _title, text: errors.append(text))
+    current_page = window.main_content_stack.currentWidget()
+
+    window.take_snapshot()
+    dialog = window.findChild(QtWidgets.QDialog)
+    dialog.accept()
+
+    qtbot.waitUntil(lambda: bool(errors))
+    assert "PVs unreachable" in errors[0]
+    assert window.main_content_stack.currentWidget() is current_page
@@ -2,12 +2,13 @@ import sys
 from dataclasses import dataclass
 from typing import Optional
 
-from qtpy.QtCore import Qt
+from qtpy.QtCore import Qt, Slot
 from qtpy.QtGui import QDoubleValidator, QFont, QKeyEvent
 from qtpy.QtWidgets import (QApplication, QBoxLayout, QDialog, QGridLayout,
                             QHBoxLayout, QLabel, QLineEdit, QPushButton,
                             QVBoxLayout, QWidget)
 
+from squirrel.model import EpicsData
 from squirrel.type_hints import TagDef, TagSet
 from squirrel.widgets.tag import TagsWidget
 
@@ -135,16 +136,30 @@ class PVDetailsPopup(QWidget):
         layout.addLayout(PVDetailsRow("Relative:", QLabel(str(pv_details.tolerance_rel)), indent=1))
 
         layout.addLayout(PVDetailsRow("PV Limits", None))
-        layout.addLayout(PVDetailsRow("LOLO:", QLabel(str(pv_details.lolo)), indent=1))
-        layout.addLayout(PVDetailsRow("LOW:", QLabel(str(pv_details.low)), indent=1))
-        layout.addLayout(PVDetailsRow("HIGH:", QLabel(str(pv_details.high)), indent=1))
-        layout.addLayout(PVDetailsRow("HIHI:", QLabel(str(pv_details.hihi)), indent=1))
+        self.lolo_label = QLabel(str(pv_details.lolo))
+        self.low_label = QLabel(str(pv_details.low))
+        self.high_label = QLabel(str(pv_details.high))
+        self.hihi_label = QLabel(str(pv_details.hihi))
+        layout.addLayout(PVDetailsRow("LOLO:", self.lolo_label, indent=1))
+        layout.addLayout(PVDetailsRow("LOW:", self.low_label, indent=1))
+        layout.addLayout(PVDetailsRow("HIGH:", self.high_label, indent=1))
+        layout.addLayout(PVDetailsRow("HIHI:", self.hihi_label, indent=1))
 
         tags_widget = TagsWidget(tag_groups=tag_groups, enabled=False)
         tags_widget.set_tags(pv_details.tags)
         layout.addLayout(PVDetailsRow("Tags", tags_widget, direction=QBoxLayout.TopToBottom))
         layout.addStretch()
 
+    @Slot(object)
+    def set_limits(self, epics_data: Optional[EpicsData]) -> None:
+        """Fill in the alarm limits once they have been read from the PV"""
+        if not isinstance(epics_data, EpicsData):
+            return
+        self.lolo_label.setText(str(epics_data.lower_alarm_limit))
+        self.low_label.setText(str(epics_data.lower_warning_limit))
+        self.high_label.setText(str(epics_data.upper_warning_limit))
+        self.hihi_label.setText(str(epics_data.upper_alarm_limit))
+
 
 class PVDetailsPopupEditable(QDialog):
     """Editable popup for creating or editing PVs."""
@@ -10,6 +10,8 @@ class SquirrelTableView(QtWidgets.QTableView):
         self.setItemDelegate(SquirrelTableGridDelegate())
         self.verticalHeader().hide()
         self.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.setVerticalScrollMode(QtWidgets.QAbstractItemView.ScrollPerPixel)
+        self.setHorizontalScrollMode(QtWidgets.QAbstractItemView.ScrollPerPixel)
 
     def mousePressEvent(self, event):
         if event.button() == QtCore.Qt.MiddleButton:
@@ -1,13 +1,25 @@
-from typing import Any, Optional
+import contextlib
+from typing import Any, Generator, Optional
 
-import qtawesome as qta
 from qtpy import QtCore, QtGui, QtWidgets
 
 import squirrel.color
+from squirrel.qt_helpers import cached_icon
 from squirrel.type_hints import TagDef, TagSet
 from squirrel.widgets import FlowLayout
 
 
+_DEFAULT_METRICS: Optional[QtGui.QFontMetricsF] = None
+
+
+def _default_metrics() -> QtGui.QFontMetricsF:
+    """Return font metrics for the application's default font, shared by all TagChips"""
+    global _DEFAULT_METRICS
+    if _DEFAULT_METRICS is None:
+        _DEFAULT_METRICS = QtGui.QFontMetricsF(QtGui.QFont())
+    return _DEFAULT_METRICS
+
+
 class TagChip(QtWidgets.QFrame):
     """
     A UI element representing active tags for one tag group. TagsWidget uses multiple to
@@ -38,39 +50,78 @@ class TagChip(QtWidgets.QFrame):
     def __init__(self, tag_group: int, choices: dict[int, str], tag_name: str, desc: str = "", enabled: bool = False, **kwargs: Any) -> None:
         super().__init__(**kwargs)
 
+        self._size_hint_cache = None
+        self._pixmap_cache: Optional[QtGui.QPixmap] = None
+        self._pixmap_key = None
+        self._border_path = QtGui.QPainterPath()
+        self._border_rect = QtCore.QRect()
+
         self.tag_group = tag_group
         self.tag_name = tag_name
         self.choices = choices
         self.tags = set()
+        # snapshot of self.tags, guards against callers mutating the set in place
+        self._tags_frozen: frozenset[int] = frozenset()
+        self._tag_strings_sorted: tuple[str, ...] = ()
+        self._tags_joined = ""
+        self._tags_width = 0.0
         self.setToolTip(desc)
 
-        self.editor = TagEditor(self.choices, self.tags, parent=self)
-        self.editor.tagsChanged.connect(self.set_tags)
-        self.editor.hide()
+        # built on first use, read-only chips never need one
+        self._editor: Optional[TagEditor] = None
 
         self.button_rect = QtCore.QRect()
 
         self.setEnabled(enabled)
         self.adjustSize()
 
+    def resizeEvent(self, event):
+        self._center_contents()
+        super().resizeEvent(event)
+
+    def _center_contents(self) -> None:
+        """Pad the contents margins so the chip is centered when given extra space"""
+        margins = QtCore.QMargins()
+        size = self.size()
+        hint = self.sizeHint()
+        if size.width() > hint.width():
+            margins.setLeft((size.width() - hint.width()) // 2)
+            margins.setRight((size.width() - hint.width()) // 2)
+        if size.height() > hint.height():
+            margins.setTop((size.height() - hint.height()) // 2)
+            margins.setBottom((size.height() - hint.height()) // 2)
+        if margins != self.contentsMargins():
+            self.setContentsMargins(margins)
+
     def paintEvent(self, event):
+        if not event.rect().intersects(self.contentsRect()):
+            return
+
+        # the chip's appearance only depends on this key, so reuse the last render if able
+        key = (self.size(), self.contentsRect(), self.tag_name, self._tags_joined, self.isEnabled())
+        if self._pixmap_cache is None or key != self._pixmap_key:
+            self._pixmap_cache = self._render_pixmap()
+            self._pixmap_key = key
         painter = QtGui.QPainter(self)
-        margins = self.contentsMargins()
-        if event.rect().width() > self.sizeHint().width():
-            margins.setLeft((event.rect().width() - self.sizeHint().width()) // 2)
-            margins.setRight((event.rect().width() - self.sizeHint().width()) // 2)
-        if event.rect().height() > self.sizeHint().height():
-            margins.setTop((event.rect().height() - self.sizeHint().height()) // 2)
-            margins.setBottom((event.rect().height() - self.sizeHint().height()) // 2)
-        self.setContentsMargins(margins)
+        painter.setClipRect(event.rect())
+        painter.drawPixmap(0, 0, self._pixmap_cache)
+
+    def _render_pixmap(self) -> QtGui.QPixmap:
+        """Paint this chip onto a transparent QPixmap matching the widget's size"""
+        dpr = self.devicePixelRatioF()
+        pixmap = QtGui.QPixmap(self.size() * dpr)
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(QtCore.Qt.transparent)
+        painter = QtGui.QPainter(pixmap)
+        painter.setFont(self.font())
         self.paint(painter)
+        painter.end()
+        return pixmap
 
     def paint(self, painter):
         painter.save()
         painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
 
-        tag_strings = {self.choices[tag] for tag in self.tags}
-
         painter.setBrush(QtCore.Qt.NoBrush)
         pen = QtGui.QPen()
         pen.setWidth(2)
@@ -81,64 +132,125 @@ class TagChip(QtWidgets.QFrame):
         spacing = rect.height() / 4
 
         border_rect = self.contentsRect() - QtCore.QMargins(pen.width(), pen.width(), pen.width(), pen.width())
-        painter.drawRoundedRect(border_rect, border_rect.height() / 2, border_rect.height() / 2)
+        painter.drawPath(self._get_border_path(border_rect))
         painter.translate(self.contentsRect().topLeft())
 
         painter.setPen(QtCore.Qt.NoPen)
         self.button_rect = QtCore.QRectF((rect.height() / 2) - spacing, (rect.height() / 2) - spacing, spacing * 2, spacing * 2)
         painter.translate(self.button_rect.left(), self.button_rect.top())
         if self.isEnabled():
-            if len(tag_strings) > 0:
-                icon = qta.icon("ph.x-bold", color=squirrel.color.GREY)
+            if self._tag_strings_sorted:
+                icon = cached_icon("ph.x-bold", color=squirrel.color.GREY)
             else:
-                icon = qta.icon("ph.plus-bold", color=squirrel.color.GREY)
+                icon = cached_icon("ph.plus-bold", color=squirrel.color.GREY)
             icon.paint(painter, QtCore.QRectF(0, 0, self.button_rect.width(), self.button_rect.height()).toRect())
             painter.translate(self.button_rect.width() + (spacing / 2), 0)
         else:
             painter.translate(spacing, 0)
 
         painter.setPen(QtCore.Qt.SolidLine)
-        name_rect = QtCore.QRectF(0, 0, painter.font().pointSize() * len(self.tag_name), spacing * 2)
+        name_rect = QtCore.QRectF(0, 0, self._name_width, spacing * 2)
         painter.drawText(name_rect, self.tag_name)
         painter.translate(name_rect.right(), 0)
 
-        if len(tag_strings) > 0:
+        if self._tag_strings_sorted:
             painter.drawLine(QtCore.QPointF(-painter.pen().width(), name_rect.top()), QtCore.QPointF(-painter.pen().width(), name_rect.bottom()))
             painter.translate(spacing, 0)
 
         pen.setColor(QtGui.QColor(squirrel.color.LIGHT_BLUE))
         painter.setPen(pen)
-        tags_string = ", ".join(sorted(tag_strings))
-        tags_rect = QtCore.QRectF(0, 0, painter.font().pointSize() * len(tags_string), name_rect.height())
-        painter.drawText(tags_rect, tags_string)
+        tags_rect = QtCore.QRectF(0, 0, self._tags_width, name_rect.height())
+        painter.drawText(tags_rect, self._tags_joined)
 
         painter.restore()
         painter.translate(rect.topRight())
 
+    def _get_border_path(self, border_rect: QtCore.QRect) -> QtGui.QPainterPath:
+        """Return the chip's rounded border outline, rebuilding it only when border_rect changes"""
+        if border_rect != self._border_rect:
+            path = QtGui.QPainterPath()
+            path.addRoundedRect(QtCore.QRectF(border_rect), border_rect.height() / 2, border_rect.height() / 2)
+            self._border_path = path
+            self._border_rect = border_rect
+        return self._border_path
+
+    @property
+    def editor(self) -> "TagEditor":
+        """The popup used to edit this chip's active tags, constructed on first access"""
+        if self._editor is None:
+            self._editor = TagEditor(self.choices, self.tags, parent=self)
+            self._editor.tagsChanged.connect(self.set_tags)
+            self._editor.hide()
+        return self._editor
+
+    @property
+    def tag_name(self) -> str:
+        return self._tag_name
+
+    @tag_name.setter
+    def tag_name(self, tag_name: str) -> None:
+        self._tag_name = tag_name
+        self._name_width = _default_metrics().horizontalAdvance(tag_name)
+        self._size_hint_cache = None
+        self.updateGeometry()
+
+    def changeEvent(self, event):
+        if event.type() == QtCore.QEvent.ApplicationFontChange:
+            global _DEFAULT_METRICS
+            _DEFAULT_METRICS = None
+            self._size_hint_cache = None
+            self._name_width = _default_metrics().horizontalAdvance(self.tag_name)
+            self._tags_width = _default_metrics().horizontalAdvance(self._tags_joined)
+        elif event.type() == QtCore.QEvent.EnabledChange:
+            self._size_hint_cache = None
+        super().changeEvent(event)
+
     def sizeHint(self):
-        metrics = QtGui.QFontMetricsF(QtGui.QFont())
-        tag_strings = {self.choices[tag] for tag in self.tags}
-        text = self.tag_name + ", ".join(sorted(tag_strings))
+        if self._size_hint_cache is not None:
+            return self._size_hint_cache
+        metrics = _default_metrics()
+        text = self.tag_name + self._tags_joined
         text_size = metrics.size(QtCore.Qt.TextSingleLine, text)
         height = text_size.height() * 2
         spacing = height / 4
         spaces = 7 if len(self.tags) > 0 else 4
         spaces += int(self.isEnabled())
-        return QtCore.QSizeF(text_size.width() + (spaces * spacing), height).toSize()
+        self._size_hint_cache = QtCore.QSizeF(text_size.width() + (spaces * spacing), height).toSize()
+        return self._size_hint_cache
 
     def minimumSize(self):
         return self.sizeHint()
 
     def set_tags(self, tags: set[int]) -> None:
-        """Set this widget's active tags and redraw."""
+        """Set this widget's active tags and redraw. Does nothing if the tags are unchanged."""
+        tags_frozen = frozenset(tags)
+        if tags_frozen == self._tags_frozen:
+            return
+        self._size_hint_cache = None
         self.tags = tags
+        self._tags_frozen = tags_frozen
+        self._update_tag_strings()
+        if self._editor is not None:
+            self._editor.set_selected(tags)
         self.updateGeometry()
+        if self.isVisible():
+            self._center_contents()
         self.tagsChanged.emit(self.tags)
 
     def clear(self) -> None:
         """Clear this widget's active tags."""
+        self._size_hint_cache = None
         self.tags = set()
-        self.editor.choice_list.clearSelection()
+        self._tags_frozen = frozenset()
+        self._update_tag_strings()
+        if self._editor is not None:
+            self._editor.choice_list.clearSelection()
+
+    def _update_tag_strings(self) -> None:
+        """Cache the sorted names and text width of the active tags for paint() and sizeHint()"""
+        self._tag_strings_sorted = tuple(sorted({self.choices[tag] for tag in self.tags}))
+        self._tags_joined = ", ".join(self._tag_strings_sorted)
+        self._tags_width = _default_metrics().horizontalAdvance(self._tags_joined)
 
     def mouseReleaseEvent(self, event):
         if len(self.tags) > 0 and self.button_rect.contains(event.pos()):
@@ -147,6 +259,41 @@ class TagChip(QtWidgets.QFrame):
             self.editor.show()
 
 
+class _TagListModel(QtCore.QAbstractListModel):
+    """
+    Lightweight list model for TagEditor, holding tag indices and names in parallel
+    lists rather than one item object per row.
+    """
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None) -> None:
+        super().__init__(parent)
+        self._ids: list[int] = []
+        self._names: list[str] = []
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._ids)
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        if role == QtCore.Qt.DisplayRole:
+            return self._names[index.row()]
+        elif role == QtCore.Qt.UserRole:
+            return self._ids[index.row()]
+        return None
+
+    def set_choices(self, choices: dict[int, str]) -> None:
+        self.beginResetModel()
+        self._ids = list(choices.keys())
+        self._names = list(choices.values())
+        self.endResetModel()
+
+    def tag_id(self, row: int) -> int:
+        return self._ids[row]
+
+
 class TagEditor(QtWidgets.QWidget):
     """
     Popup for selecting a TagChip's active tags.
@@ -183,32 +330,63 @@ class TagEditor(QtWidgets.QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
         self.setLayout(layout)
 
-        self.choice_list = QtWidgets.QListWidget()
+        self.choice_model = _TagListModel(self)
+        self.choice_list = QtWidgets.QListView()
+        self.choice_list.setModel(self.choice_model)
         self.choice_list.setSelectionMode(self.choice_list.SelectionMode.MultiSelection)
         self.layout().addWidget(self.choice_list)
+        self._updating_selection = False
         self.set_choices(choices)
+        self.set_selected(selected)
 
-        self.choice_list.itemSelectionChanged.connect(self.emitTagsChanged)
+        self.choice_list.selectionModel().selectionChanged.connect(self.emitTagsChanged)
 
     def emitTagsChanged(self):
         """
         Emits self.tagsChanged with the new set of selected tag indices. Needed so that
-        self.tagsChanged can emit the required data despite being connected to the data-less
-        QListWidget.itemSelectionChanged signal.
+        self.tagsChanged can emit the required data despite being connected to the
+        QItemSelectionModel.selectionChanged signal.
+        """
+        if self._updating_selection:
+            return
+        self.tagsChanged.emit(self.get_selected())
+
+    def get_selected(self) -> set[int]:
+        """Returns the set of selected tag indices"""
+        return {
+            self.choice_model.tag_id(index.row())
+            for index in self.choice_list.selectionModel().selectedIndexes()
+        }
+
+    def set_selected(self, selected: set[int]) -> None:
+        """
+        Select the rows for the given tag indices in a single selection change, without
+        emitting tagsChanged.
         """
-        selected = {item.data(QtCore.Qt.UserRole) for item in self.choice_list.selectedItems()}
-        self.tagsChanged.emit(selected)
+        if selected == self.get_selected():
+            return
+        selection = QtCore.QItemSelection()
+        for row in range(self.choice_model.rowCount()):
+            if self.choice_model.tag_id(row) in selected:
+                index = self.choice_model.index(row, 0)
+                selection.select(index, index)
+        self._updating_selection = True
+        try:
+            self.choice_list.selectionModel().select(
+                selection, QtCore.QItemSelectionModel.SelectionFlag.ClearAndSelect
+            )
+        finally:
+            self._updating_selection = False
 
     def set_choices(self, choices: dict[int, str]) -> None:
         """
-        Set this widget's tag choices. Clears and then re-populates choice_list, with each
-        list item containing both the tag index and name.
+        Set this widget's tag choices. Resets choice_model, which holds both the tag
+        indices and names.
         """
-        self.choice_list.clear()
-        for tag, string in choices.items():
-            self.choice_list.addItem(string)
-            item = self.choice_list.item(self.choice_list.count() - 1)
-            item.setData(QtCore.Qt.UserRole, tag)
+        had_selection = self.choice_list.selectionModel().hasSelection()
+        self.choice_model.set_choices(choices)
+        if had_selection:
+            self.emitTagsChanged()
 
     def show(self):
         corner = self.parent().rect().bottomLeft()
@@ -256,6 +434,11 @@ class TagsWidget(QtWidgets.QWidget):
         """
         super().__init__(*args, **kwargs)
 
+        self._chips: list[TagChip] = []
+        self._chips_by_group: dict[int, TagChip] = {}
+        self._chip_details: dict[int, tuple[str, str, dict[int, str]]] = {}
+        self._visible_chips: list[TagChip] = []
+
         self.setLayout(FlowLayout(margin=0, spacing=5))
         self.layout().setObjectName("TagChipFlowLayout")
         self.set_tag_groups(tag_groups)
@@ -268,26 +451,83 @@ class TagsWidget(QtWidgets.QWidget):
         self.tagSetChanged.emit(self.get_tag_set())
 
     def set_tag_groups(self, tag_groups: TagDef) -> None:
-        while self.layout().count() > 0:
-            self.layout().takeAt(0)
-        for tag_group, details in tag_groups.items():
-            chip = TagChip(tag_group, details[2], details[0], desc=details[1], enabled=self.isEnabled())
-            chip.tagsChanged.connect(self.emitTagSetChanged)
-            self.layout().addWidget(chip)
+        """
+        Set the tag groups displayed by this widget. Chips for groups whose name,
+        description, and choices are unchanged are kept, the rest are rebuilt or deleted.
+        """
+        updates_enabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        try:
+            while self.layout().count() > 0:
+                self.layout().takeAt(0)
+            old_chips = self._chips_by_group
+            old_details = self._chip_details
+            self._chips = []
+            self._chips_by_group = {}
+            self._chip_details = {}
+            for tag_group, details in tag_groups.items():
+                # copy the details, as backends may mutate their tag groups in place
+                chip_details = (details[0], details[1], dict(details[2]))
+                chip = old_chips.pop(tag_group, None)
+                if chip is not None and old_details.get(tag_group) != chip_details:
+                    chip.hide()
+                    chip.deleteLater()
+                    chip = None
+                if chip is None:
+                    chip = TagChip(tag_group, details[2], details[0], desc=details[1], enabled=self.isEnabled())
+                    chip.tagsChanged.connect(self._rebuild_visible)
+                    chip.tagsChanged.connect(self.emitTagSetChanged)
+                self.layout().addWidget(chip)
+                self._chips.append(chip)
+                self._chips_by_group[tag_group] = chip
+                self._chip_details[tag_group] = chip_details
+            for chip in old_chips.values():
+                chip.hide()
+                chip.deleteLater()
+        finally:
+            self.setUpdatesEnabled(updates_enabled)
+        self.layout().invalidate()
         self.tag_groups = tag_groups
+        self._rebuild_visible()
+
+    def _rebuild_visible(self) -> None:
+        """Cache the chips that paint() draws: editable chips, or those with active tags"""
+        self._visible_chips = [chip for chip in self._chips if chip.isEnabled() or len(chip.tags) > 0]
+
+    def changeEvent(self, event):
+        if event.type() == QtCore.QEvent.EnabledChange:
+            self._rebuild_visible()
+        super().changeEvent(event)
+
+    @contextlib.contextmanager
+    def _batch_update(self) -> Generator[None, None, None]:
+        """
+        Context manager that silences the child TagChips while they are updated in
+        bulk, then emits tagSetChanged once on exit
+        """
+        was_blocked = [chip.blockSignals(True) for chip in self._chips]
+        try:
+            yield
+        finally:
+            for chip, blocked in zip(self._chips, was_blocked):
+                chip.blockSignals(blocked)
+            self._rebuild_visible()
+        self.emitTagSetChanged()
 
     def clear_tags(self) -> None:
         """Clears all tags in all TagChips"""
-        chips = self.findChildren(TagChip)
-        for chip in chips:
-            chip.clear()
+        with self._batch_update():
+            for chip in self._chips:
+                chip.clear()
 
     def set_tags(self, tag_set: TagSet) -> None:
         """Sets the child TagChips according to the provided TagSet"""
-        self.clear_tags()
-        for tag_group, tags in tag_set.items():
-            chip = self.get_group_chip(tag_group)
-            if isinstance(chip, TagChip):
+        with self._batch_update():
+            for tag_group, chip in self._chips_by_group.items():
+                tags = tag_set.get(tag_group)
+                if tags is None:
+                    chip.clear()
+                    continue
                 chip.set_tags(tags)
                 if len(tags) == 0:
                     chip.hide()
@@ -296,51 +536,75 @@ class TagsWidget(QtWidgets.QWidget):
 
     def get_tag_set(self) -> TagSet:
         """Constructs the TagSet representation of the child TagChips"""
-        tag_set = {}
-        chips = self.findChildren(TagChip)
-        for chip in chips:
-            tag_set[chip.tag_group] = chip.tags
-        return tag_set
+        return {chip.tag_group: chip.tags for chip in self._chips}
 
     def get_group_chip(self, tag_group: int) -> Optional[TagChip]:
         """Returns TagChip corresponding to the desired tag group, or None if chip was not found"""
-        chips = self.findChildren(TagChip)
-        for chip in chips:
-            if chip.tag_group == tag_group:
-                return chip
-        return None
+        return self._chips_by_group.get(tag_group)
 
     def paint(self, painter):
         first_item = self.layout().itemAt(0)
         if first_item:  # will be None if widget doesn't have any active tags
             painter.translate(first_item.widget().pos())
-        for i in range(self.layout().count()):
-            chip = self.layout().itemAt(i).widget()
-            if chip.isEnabled() or len(chip.tags) > 0:
-                chip.paint(painter)
+        for chip in self._visible_chips:
+            chip.paint(painter)
         painter.resetTransform()
 
 
 class TagDelegate(QtWidgets.QStyledItemDelegate):
+    # rendered rows kept before the pixmap cache is flushed
+    max_cached_pixmaps = 256
+
     def __init__(self, tag_def, parent=None):
         super().__init__(parent)
         self.tag_def = tag_def
-        self.widgets = {}
+        # a single read-only widget is re-used to paint and measure every row
+        self._shared_widget = TagsWidget(tag_groups=self.tag_def, enabled=False)
+        # the widget is parentless, so release it along with this delegate
+        self.destroyed.connect(self._shared_widget.deleteLater)
+        self._pixmap_cache: dict[tuple, QtGui.QPixmap] = {}
+        self._height_cache: dict[tuple, int] = {}
+
+    @staticmethod
+    def _tag_set_key(tag_set: TagSet) -> frozenset:
+        return frozenset((group, frozenset(tags)) for group, tags in tag_set.items())
 
     def paint(self, painter, option, index):
-        tag_widget = self._get_tag_widget(index)
-        tag_widget.layout().setGeometry(option.rect)
-        tag_widget.paint(painter)
+        tag_set = index.data()
+        key = (option.rect.width(), option.rect.height(), self._tag_set_key(tag_set))
+        pixmap = self._pixmap_cache.get(key)
+        if pixmap is None:
+            if len(self._pixmap_cache) >= self.max_cached_pixmaps:
+                self._pixmap_cache.clear()
+            pixmap = self._render_pixmap(tag_set, option, painter.device().devicePixelRatioF())
+            self._pixmap_cache[key] = pixmap
+        painter.drawPixmap(option.rect.topLeft(), pixmap)
 
     def sizeHint(self, option, index):
-        tag_widget = self._get_tag_widget(index)
+        # rows sharing a tag set at the same width wrap identically, so only lay out each pair once
         width = option.rect.width()
-        height = tag_widget.heightForWidth(width)
+        key = (width, self._tag_set_key(index.data()))
+        height = self._height_cache.get(key)
+        if height is None:
+            if len(self._height_cache) >= self.max_cached_pixmaps:
+                self._height_cache.clear()
+            height = self._get_tag_widget(index).heightForWidth(width)
+            self._height_cache[key] = height
         return QtCore.QSize(width, height)
 
     def _get_tag_widget(self, index):
-        row = index.row()
-        if row not in self.widgets:
-            self.widgets[row] = TagsWidget(tag_groups=self.tag_def, enabled=False)
-        self.widgets[row].set_tags(index.data())
-        return self.widgets[row]
+        self._shared_widget.set_tags(index.data())
+        return self._shared_widget
+
+    def _render_pixmap(self, tag_set: TagSet, option, dpr: float) -> QtGui.QPixmap:
+        """Paint the shared TagsWidget for tag_set onto a transparent QPixmap the size of option.rect"""
+        self._shared_widget.set_tags(tag_set)
+        pixmap = QtGui.QPixmap(option.rect.size() * dpr)
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(QtCore.Qt.transparent)
+        painter = QtGui.QPainter(pixmap)
+        painter.setFont(option.font)
+        self._shared_widget.layout().setGeometry(QtCore.QRect(QtCore.QPoint(0, 0), option.rect.size()))
+        self._shared_widget.paint(painter)
+        painter.end()
+        return pixmap
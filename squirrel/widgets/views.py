@@ -8,7 +8,7 @@ import logging
 import time
 from enum import Enum, IntEnum, auto
 from functools import partial
-from typing import Any, Callable, ClassVar, Dict, List, Optional, Union
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Set, Union
 from uuid import UUID
 
 import numpy as np
@@ -153,6 +153,7 @@ class BaseTableEntryModel(QtCore.QAbstractTableModel):
     _editable_cols: Dict[int, bool] = {}
     _button_cols: List[HeaderEnum]
     _header_to_field: Dict[HeaderEnum, str]
+    _entry_uuids: Optional[Set[UUID]]
 
     def __init__(
         self,
@@ -161,6 +162,7 @@ class BaseTableEntryModel(QtCore.QAbstractTableModel):
         **kwargs
     ) -> None:
         self.entries = entries or []
+        self._entry_uuids = None
         super().__init__(*args, **kwargs)
 
     def rowCount(self, parent_index: Optional[QtCore.QModelIndex] = None):
@@ -172,12 +174,13 @@ class BaseTableEntryModel(QtCore.QAbstractTableModel):
     def set_entries(self, entries: List[Entry]):
         """
         Set the entries for this table.  Subclasses will need to override
-        in order to encapsulate all logic between `layoutAboutToBeChanged` and
-        `layoutChanged` signals.  (super().set_entries should not be called)
+        in order to encapsulate all logic between `beginResetModel` and
+        `endResetModel`.  (super().set_entries should not be called)
         """
-        self.layoutAboutToBeChanged.emit()
+        self.beginResetModel()
         self.entries = entries
-        self.layoutChanged.emit()
+        self._entry_uuids = None
+        self.endResetModel()
 
     def headerData(
         self,
@@ -214,7 +217,6 @@ class BaseTableEntryModel(QtCore.QAbstractTableModel):
             # only set values on entries with the field
             return True
 
-        self.layoutAboutToBeChanged.emit()
         try:
             setattr(entry, header_field, value)
             success = True
@@ -223,7 +225,7 @@ class BaseTableEntryModel(QtCore.QAbstractTableModel):
                          f"({index.row()}, {index.column()}): {exc}")
             success = False
 
-        self.layoutChanged.emit()
+        # row count is unchanged, so only the edited cell needs refreshing
         self.dataChanged.emit(index, index)
         return success
 
@@ -250,25 +252,47 @@ class BaseTableEntryModel(QtCore.QAbstractTableModel):
         else:
             return QtCore.Qt.ItemIsEnabled
 
+    def _get_entry_uuids(self) -> Set[UUID]:
+        """
+        Return the uuids of the entries in this table, building the set if
+        the entries have been replaced or removed since last use
+        """
+        if self._entry_uuids is None:
+            self._entry_uuids = {entry.uuid for entry in self.entries if entry.uuid}
+        return self._entry_uuids
+
     def add_entry(self, entry: Entry) -> None:
-        if entry in self.entries or not isinstance(entry, Entry):
+        if not isinstance(entry, Entry):
             return
 
-        self.layoutAboutToBeChanged.emit()
-        self.entries.append[entry]
-        self.layoutChanged.emit()
+        # entries without a uuid yet can only be told apart by comparison
+        if entry.uuid:
+            if entry.uuid in self._get_entry_uuids():
+                return
+        elif entry in self.entries:
+            return
+
+        row_index = len(self.entries)
+        self.beginInsertRows(QtCore.QModelIndex(), row_index, row_index)
+        self.entries.append(entry)
+        self.endInsertRows()
+        if entry.uuid:
+            self._entry_uuids.add(entry.uuid)
 
     def remove_row(self, row_index: int) -> None:
-        self.remove_entry(self.entries[row_index])
+        self.beginRemoveRows(QtCore.QModelIndex(), row_index, row_index)
+        del self.entries[row_index]
+        self._entry_uuids = None
+        self.endRemoveRows()
 
     def remove_entry(self, entry: Entry) -> None:
-        self.layoutAboutToBeChanged.emit()
         try:
-            self.entries.remove(entry)
+            row_index = self.entries.index(entry)
         except ValueError:
             logger.debug(f"Entry of type ({type(entry).__name__})"
                          "not found in table, could not remove.")
-        self.layoutChanged.emit()
+            return
+        self.remove_row(row_index)
 
 
 class DisplayType(Enum):
@@ -296,8 +320,14 @@ class LivePVTableModel(BaseTableEntryModel):
     # Takes PV-entries
     # shows live details (current PV status, severity)
     # shows setpoints (can be blank)
-    headers: List[str]
+    header_enum = LivePVHeader
+    headers: ClassVar[List[str]] = [h.header_name() for h in LivePVHeader]
+    _default_editable_cols: ClassVar[Dict[int, bool]] = {
+        h.value: h in (LivePVHeader.OPEN, LivePVHeader.REMOVE) for h in LivePVHeader
+    }
     _data_cache: Dict[str, EpicsData]
+    _address_rows: Optional[Dict[str, List[int]]]
+    _pending_rows: Set[int]
     _poll_thread: Optional[_PVPollThread]
     _button_cols: List[LivePVHeader] = [LivePVHeader.OPEN, LivePVHeader.REMOVE]
     _header_to_field: Dict[LivePVHeader, str] = {
@@ -316,16 +346,16 @@ class LivePVTableModel(BaseTableEntryModel):
         **kwargs
     ) -> None:
         super().__init__(*args, entries=entries, **kwargs)
-        self.header_enum = LivePVHeader
-        self.headers = [h.header_name() for h in LivePVHeader]
-
-        self._editable_cols = {h.value: False for h in LivePVHeader}
-        self._editable_cols[LivePVHeader.OPEN] = True
-        self._editable_cols[LivePVHeader.REMOVE] = True
+        # copied per instance, since set_editable modifies it
+        self._editable_cols = dict(self._default_editable_cols)
 
         self.client = client
+        self.entries = self._resolve_entries(self.entries)
+        self._entry_uuids = None
         self.poll_period = poll_period
-        self._data_cache = {e.setpoint: None for e in entries if e.setpoint} | {e.readback: None for e in entries if e.readback}
+        self._data_cache = {e.setpoint: None for e in self.entries if e.setpoint} | {e.readback: None for e in self.entries if e.readback}
+        self._address_rows = None
+        self._pending_rows = set()
         self._poll_thread = None
 
         self.start_polling()
@@ -389,38 +419,87 @@ class LivePVTableModel(BaseTableEntryModel):
     def _data_changed(self, address: str) -> None:
         """
         Slot: data changed for the given attribute in the thread.
-        Signals the entire row to update (a single PV worth of data)
+        Marks each row using ``address`` for update.  Rows changed by a burst
+        of poll updates are signalled together once the event loop is idle.
         """
-        try:
-            row = list(self._data_cache).index(address)
-        except IndexError:
-            ...
-        else:
-            self.dataChanged.emit(
-                self.createIndex(row, 0),
-                self.createIndex(row, self.columnCount()),
-            )
+        rows = self._get_address_rows().get(address)
+        if not rows:
+            return
+
+        if not self._pending_rows:
+            QtCore.QTimer.singleShot(0, self._emit_pending_rows)
+        self._pending_rows.update(rows)
+
+    @QtCore.Slot()
+    def _emit_pending_rows(self) -> None:
+        """Slot: emit a single dataChanged spanning all rows marked for update"""
+        if not self._pending_rows:
+            return
+
+        first_row = min(self._pending_rows)
+        last_row = min(max(self._pending_rows), self.rowCount() - 1)
+        self._pending_rows.clear()
+        if first_row > last_row:
+            return
+
+        self.dataChanged.emit(
+            self.createIndex(first_row, 0),
+            self.createIndex(last_row, self.columnCount() - 1),
+        )
+
+    def _get_address_rows(self) -> Dict[str, List[int]]:
+        """
+        Return a mapping from setpoint and readback addresses to the rows
+        that use them, building it if the entries have changed since last use
+        """
+        if self._address_rows is None:
+            address_rows = {}
+            for row, entry in enumerate(self.entries):
+                for address in (entry.setpoint, entry.readback):
+                    if address:
+                        address_rows.setdefault(address, []).append(row)
+            self._address_rows = address_rows
+        return self._address_rows
 
     def set_entries(self, entries: list[PV]) -> None:
         """Set the entries for this table, reset data cache"""
-        self.layoutAboutToBeChanged.emit()
+        entries = self._resolve_entries(entries)
+        self.beginResetModel()
         self.entries = entries
+        self._entry_uuids = None
         self._data_cache = {e.setpoint: None for e in entries if e.setpoint} | {e.readback: None for e in entries if e.readback}
+        self._address_rows = None
+        self._pending_rows.clear()
         # self._poll_thread.data = self._data_cache
-        self.dataChanged.emit(
-            self.createIndex(0, 0),
-            self.createIndex(self.rowCount(), self.columnCount()),
-        )
-        self.layoutChanged.emit()
+        self.endResetModel()
+
+    def _resolve_entries(self, entries: List[Union[PV, UUID]]) -> List[PV]:
+        """
+        Replace any bare ids in ``entries`` with their PVs, using a single
+        backend search for all of them.  Returns ``entries`` itself if there
+        are none to resolve.
+        """
+        uuids = tuple(entry for entry in entries if type(entry) is not PV)
+        if not uuids:
+            return entries
 
-    def remove_entry(self, entry: PV) -> None:
-        """Remove ``entry`` from the table model"""
-        super().remove_entry(entry)
-        self.layoutAboutToBeChanged.emit()
+        found = {pv.uuid: pv for pv in self.client.search(("uuid", "in", uuids))}
+        return [entry if type(entry) is PV else found[entry] for entry in entries]
+
+    def add_entry(self, entry: PV) -> None:
+        """Add ``entry`` to the end of the table model"""
+        super().add_entry(entry)
+        self._address_rows = None
+
+    def remove_row(self, row_index: int) -> None:
+        """Remove the entry at ``row_index`` and its live data from the table model"""
+        entry = self.entries[row_index]
+        super().remove_row(row_index)
+        self._address_rows = None
         self._data_cache.pop(entry.setpoint, None)
         self._data_cache.pop(entry.readback, None)
-        self._poll_thread.data = self._data_cache
-        self.layoutChanged.emit()
+        if self._poll_thread is not None:
+            self._poll_thread.data = self._data_cache
 
     def index_from_item(
         self,
@@ -472,10 +551,6 @@ class LivePVTableModel(BaseTableEntryModel):
             the requested data
         """
         entry: PV = self.entries[index.row()]
-        if isinstance(entry, UUID):
-            entry = self.client.backend.get_entry(self.entries[index.row()])
-            self.entries[index.row()] = entry
-
         if index.column() == LivePVHeader.PV_NAME:
             if role == QtCore.Qt.DecorationRole:
                 return self.icon(entry)
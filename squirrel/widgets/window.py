@@ -8,7 +8,6 @@ import logging
 from functools import partial
 from typing import Optional
 
-import qtawesome as qta
 from epicscorelibs.ca.cadef import CAException
 from qtpy import QtCore, QtGui, QtWidgets
 from qtpy.QtGui import QCloseEvent
@@ -18,8 +17,10 @@ from squirrel.model import PV, EpicsData, Snapshot
 from squirrel.pages import (Page, PVBrowserPage, SnapshotComparisonPage,
                             SnapshotDetailsPage, TagPage)
 from squirrel.permission_manager import PermissionManager
+from squirrel.qt_helpers import cached_icon
 from squirrel.tables import (PVTableModel, SnapshotFilterModel,
                              SnapshotTableModel)
+from squirrel.type_hints import TagDef
 from squirrel.widgets import NameDescTagsWidget, QtSingleton, SquirrelTableView
 from squirrel.widgets.date_range import DateRangeWidget
 from squirrel.widgets.filter_bar import FilterBar
@@ -30,11 +31,42 @@ from squirrel.widgets.views import DiffDispatcher
 logger = logging.getLogger(__name__)
 
 
+def _proxy_to_source(
+    model: QtCore.QSortFilterProxyModel,
+    index: QtCore.QModelIndex,
+) -> tuple[QtCore.QAbstractItemModel, QtCore.QModelIndex]:
+    return model.sourceModel(), model.mapToSource(index)
+
+
+def _model_to_source(
+    model: QtCore.QAbstractItemModel,
+    index: QtCore.QModelIndex,
+) -> tuple[QtCore.QAbstractItemModel, QtCore.QModelIndex]:
+    return model, index
+
+
+# Model types accepted by Window.open_pv_details, checked in order, paired with
+# the function resolving their source model and index
+_MODEL_TO_SOURCE = (
+    (QtCore.QSortFilterProxyModel, _proxy_to_source),
+    (PVTableModel, _model_to_source),
+)
+
+
 class Window(QtWidgets.QMainWindow, metaclass=QtSingleton):
     """Main squirrel window"""
 
     # Diff dispatcher singleton, used to notify when diffs are ready
     diff_dispatcher: DiffDispatcher = DiffDispatcher()
+    # Delay after the last filter edit before the snapshot table is re-filtered
+    FILTER_DEBOUNCE_MS = 250
+
+    # Emitted from a worker thread with (popup, epics_data) once PV alarm limits are read
+    sigLimitsFetched = QtCore.Signal(object, object)
+    # Emitted from a worker thread with the new Snapshot once it has been saved
+    sigSnapshotSaved = QtCore.Signal(object)
+    # Emitted from a worker thread with an error message if saving a snapshot failed
+    sigSnapshotSaveFailed = QtCore.Signal(str)
 
     def __init__(self, *args, client: Optional[Client] = None, **kwargs):
         super().__init__(*args, **kwargs)
@@ -42,30 +74,31 @@ class Window(QtWidgets.QMainWindow, metaclass=QtSingleton):
             self.client = client
         else:
             self.client = Client.from_config()
-        self.pages: set[Page] = set()
+        self.pages: list[Page] = []
+        self._tag_groups_cache: Optional[TagDef] = None
         self.setup_ui()
+        self.sigLimitsFetched.connect(self._on_limits_fetched)
+        self.sigSnapshotSaved.connect(self._on_snapshot_saved)
+        self.sigSnapshotSaveFailed.connect(self._on_snapshot_save_failed)
 
         self.permission_manager = PermissionManager.get_instance()
 
     def setup_ui(self) -> None:
         self.navigation_panel = self.init_nav_panel()
 
-        # Initialize content pages and add to stack
-        self.view_snapshot_page = self.init_view_snapshot_page()
-        self.snapshot_details_page = self.init_snapshot_details_page()
-        self.comparison_page = self.init_comparison_page()
-        self.pv_browser_page = self.init_pv_browser_page()
-        self.configure_page = self.init_configure_page()
+        self.main_content_stack = QtWidgets.QStackedLayout()
 
-        self.pages.add(self.view_snapshot_page)
-        self.pages.add(self.snapshot_details_page)
-        self.pages.add(self.comparison_page)
-        self.pages.add(self.pv_browser_page)
-        self.pages.add(self.configure_page)
+        # Only the initially shown page is built up front, others are built when first opened
+        self._page_factories = {
+            "snapshot_details_page": self.init_snapshot_details_page,
+            "comparison_page": self.init_comparison_page,
+            "pv_browser_page": self.init_pv_browser_page,
+            "configure_page": self.init_configure_page,
+        }
+        self._page_cache: dict[str, QtWidgets.QWidget] = {}
 
-        self.main_content_stack = QtWidgets.QStackedLayout()
-        for page in self.pages:
-            self.main_content_stack.addWidget(page)
+        self.view_snapshot_page = self.init_view_snapshot_page()
+        self._add_page(self.view_snapshot_page)
         self.main_content_stack.setCurrentWidget(self.view_snapshot_page)
 
         self.main_content_container = QtWidgets.QWidget()
@@ -81,12 +114,47 @@ class Window(QtWidgets.QMainWindow, metaclass=QtSingleton):
         central_widget.layout().setContentsMargins(0, 0, 0, 0)
         self.setCentralWidget(central_widget)
 
+    def _add_page(self, page: QtWidgets.QWidget) -> None:
+        """Track a page and add it to the main content stack"""
+        self.pages.append(page)
+        self.main_content_stack.addWidget(page)
+
+    def _get_page(self, name: str) -> QtWidgets.QWidget:
+        """Return the named page, building it and adding it to the stack on first access"""
+        try:
+            return self._page_cache[name]
+        except KeyError:
+            page = self._page_factories[name]()
+            self._page_cache[name] = page
+            self._add_page(page)
+            return page
+
+    @property
+    def snapshot_details_page(self) -> SnapshotDetailsPage:
+        return self._get_page("snapshot_details_page")
+
+    @property
+    def comparison_page(self) -> SnapshotComparisonPage:
+        return self._get_page("comparison_page")
+
+    @property
+    def pv_browser_page(self) -> PVBrowserPage:
+        return self._get_page("pv_browser_page")
+
+    @property
+    def configure_page(self) -> QtWidgets.QWidget:
+        return self._get_page("configure_page")
+
     def init_nav_panel(self) -> NavigationPanel:
         navigation_panel = NavigationPanel()
-        navigation_panel.sigViewSnapshots.connect(self.open_view_snapshot_page)
-        navigation_panel.sigBrowsePVs.connect(self.open_pv_browser_page)
+        # Page opened by each nav button, looked up by attribute so lazy pages are built on first use
+        self._nav_dispatch = {
+            navigation_panel.view_snapshots_button: "view_snapshot_page",
+            navigation_panel.browse_pvs_button: "pv_browser_page",
+            navigation_panel.configure_tags_button: "configure_page",
+        }
+        navigation_panel.sigNavButtonClicked.connect(self.open_nav_page)
         navigation_panel.sigSave.connect(self.take_snapshot)
-        navigation_panel.sigConfigureTags.connect(self.open_configure_page)
         navigation_panel.set_nav_button_selected(navigation_panel.view_snapshots_button)
         navigation_panel.setSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Preferred)
         return navigation_panel
@@ -110,13 +178,14 @@ class Window(QtWidgets.QMainWindow, metaclass=QtSingleton):
         search_bar = QtWidgets.QLineEdit()
         search_bar.setClearButtonEnabled(True)
         search_bar.addAction(
-            qta.icon("fa5s.search"),
+            cached_icon("fa5s.search"),
             QtWidgets.QLineEdit.TrailingPosition,
         )
         search_bar.setPlaceholderText("Search title...")
+        self.snapshot_search_bar = search_bar
         filters_layout.addWidget(search_bar)
 
-        filter_toggle_button = QtWidgets.QPushButton(qta.icon("fa5s.filter"), "Filter  ")
+        filter_toggle_button = QtWidgets.QPushButton(cached_icon("fa5s.filter"), "Filter  ")
         filter_toggle_button.setLayoutDirection(QtCore.Qt.RightToLeft)  # Put the filter icon after the button text
         filter_toggle_button.setToolTip("Show/hide meta pv filters")
         filter_toggle_button.clicked.connect(self.toggle_filter_popup)
@@ -133,6 +202,8 @@ class Window(QtWidgets.QMainWindow, metaclass=QtSingleton):
         proxy_model.setFilterCaseSensitivity(QtCore.Qt.CaseInsensitive)
         proxy_model.setSourceModel(snapshot_model)
         self.snapshot_table.setModel(proxy_model)
+        self.snapshot_source_model = snapshot_model
+        self.snapshot_proxy_model = proxy_model
         self.snapshot_table.doubleClicked.connect(self.open_snapshot_index)
         self.snapshot_table.setShowGrid(False)
         self.snapshot_table.setStyleSheet(
@@ -142,16 +213,34 @@ class Window(QtWidgets.QMainWindow, metaclass=QtSingleton):
         )
         self.snapshot_table.setSelectionBehavior(self.snapshot_table.SelectionBehavior.SelectRows)
         self.snapshot_table.verticalHeader().hide()
+        # Every snapshot row is one line tall, so never measure rows individually
+        self.snapshot_table.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
         header_view = self.snapshot_table.horizontalHeader()
         header_view.setSectionResizeMode(header_view.ResizeMode.Fixed)
         header_view.setSectionResizeMode(1, header_view.ResizeMode.Stretch)
-        self.snapshot_table.resizeColumnsToContents()
+        # Size columns from the header and timestamp format rather than scanning every row
+        timestamp_width = self.snapshot_table.fontMetrics().horizontalAdvance("0000-00-00 00:00:00")
+        header_view.resizeSection(0, max(header_view.sectionSizeHint(0), timestamp_width + 20))
+        for column in range(2, header_view.count()):
+            header_view.resizeSection(column, header_view.sectionSizeHint(column))
         view_snapshot_layout.addWidget(self.snapshot_table)
 
-        search_bar.textEdited.connect(proxy_model.setFilterFixedString)
+        # Re-filter once typing pauses rather than on every keystroke
+        search_timer = QtCore.QTimer(view_snapshot_page)
+        search_timer.setSingleShot(True)
+        search_timer.setInterval(self.FILTER_DEBOUNCE_MS)
+        search_timer.timeout.connect(self._apply_snapshot_search)
+        search_bar.textEdited.connect(search_timer.start)
         date_range.rangeChanged.connect(proxy_model.setDateRange)
 
-        # Set up the filters for the meta pv columns
+        # The meta pv filters are built the first time the filter popup is opened
+        self.meta_pv_filter_popup: Optional[QtWidgets.QFrame] = None
+        self.meta_pv_filter_bar: Optional[FilterBar] = None
+
+        return view_snapshot_page
+
+    def init_meta_pv_filter_popup(self) -> None:
+        """Build the popup holding the filters for the meta pv columns"""
         meta_columns = [pv.readback for pv in self.client.meta_pvs if pv.readback]
         self.meta_pv_filter_popup = QtWidgets.QFrame(self)
         self.meta_pv_filter_popup.setFrameShape(QtWidgets.QFrame.StyledPanel)
@@ -162,27 +251,38 @@ class Window(QtWidgets.QMainWindow, metaclass=QtSingleton):
         self.meta_pv_filter_bar = FilterBar(meta_columns)
         filter_popup_layout.addWidget(self.meta_pv_filter_bar)
 
-        self.meta_pv_filter_bar.filters_updated.connect(
-            lambda: proxy_model.setMetaPVFilters(self.meta_pv_filter_bar.get_filters())
-        )
+        meta_pv_filter_timer = QtCore.QTimer(self.meta_pv_filter_popup)
+        meta_pv_filter_timer.setSingleShot(True)
+        meta_pv_filter_timer.setInterval(self.FILTER_DEBOUNCE_MS)
+        meta_pv_filter_timer.timeout.connect(self._apply_meta_pv_filters)
+        self.meta_pv_filter_bar.filters_updated.connect(meta_pv_filter_timer.start)
 
         self.meta_pv_filter_popup.installEventFilter(self)
 
-        return view_snapshot_page
+    @QtCore.Slot()
+    def _apply_snapshot_search(self) -> None:
+        self.snapshot_proxy_model.setFilterFixedString(self.snapshot_search_bar.text())
+
+    @QtCore.Slot()
+    def _apply_meta_pv_filters(self) -> None:
+        self.snapshot_proxy_model.setMetaPVFilters(self.meta_pv_filter_bar.get_filters())
 
     def init_snapshot_details_page(self) -> SnapshotDetailsPage:
-        """Initialize the snapshot details page with the first snapshot in the snapshot_model."""
-        temp_index = self.snapshot_table.model().sourceModel().index(0, 0)
-        first_snapshot = self.snapshot_table.model().sourceModel().index_to_snapshot(temp_index)
-        snapshot_details_page = SnapshotDetailsPage(self, self.client, first_snapshot)
-        snapshot_details_page.snapshot_details_table.doubleClicked.connect(
-            lambda index: self.open_pv_details(index, snapshot_details_page.snapshot_details_table)
-        )
+        """
+        Initialize the snapshot details page. It is built when a snapshot is first opened,
+        which then sets the snapshot to display.
+        """
+        snapshot_details_page = SnapshotDetailsPage(self, self.client)
+        snapshot_details_page.snapshot_details_table.doubleClicked.connect(self._open_snapshot_pv_details)
         snapshot_details_page.back_to_main_signal.connect(self.open_view_snapshot_page)
         snapshot_details_page.comparison_signal.connect(self.open_comparison_page)
 
         return snapshot_details_page
 
+    @QtCore.Slot(QtCore.QModelIndex)
+    def _open_snapshot_pv_details(self, index: QtCore.QModelIndex) -> None:
+        self.open_pv_details(index, self.snapshot_details_page.snapshot_details_table)
+
     def init_comparison_page(self) -> SnapshotComparisonPage:
         """Initialize the snapshot comparison page so it can be opened later."""
         comparison_page = SnapshotComparisonPage(self.client, self)
@@ -205,11 +305,22 @@ class Window(QtWidgets.QMainWindow, metaclass=QtSingleton):
         configure_page.setLayout(configure_layout)
 
         self.tag_groups_window = TagPage(self.client)
+        self.tag_groups_window.tagGroupsChanged.connect(self._invalidate_tag_groups)
         self.tag_groups_window.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Preferred)
         configure_layout.addWidget(self.tag_groups_window)
 
         return configure_page
 
+    def _get_tag_groups(self) -> TagDef:
+        """Return the backend's tag groups, only fetching them again after they have been edited"""
+        if self._tag_groups_cache is None:
+            self._tag_groups_cache = self.client.backend.get_tags()
+        return self._tag_groups_cache
+
+    @QtCore.Slot()
+    def _invalidate_tag_groups(self) -> None:
+        self._tag_groups_cache = None
+
     def eventFilter(self, watched: QtCore.QObject, event: QtCore.QEvent) -> bool:
         """Event filter for the window for responding to events as needed."""
         # If the filter popup is open and the user clicks out of it, close it for them
@@ -218,29 +329,28 @@ class Window(QtWidgets.QMainWindow, metaclass=QtSingleton):
                 self.meta_pv_filter_popup.hide()
         return super().eventFilter(watched, event)
 
+    @QtCore.Slot(QtWidgets.QAbstractButton)
+    def open_nav_page(self, nav_button: QtWidgets.QAbstractButton) -> None:
+        """Open the page belonging to a nav button if it is not already open."""
+        page = getattr(self, self._nav_dispatch[nav_button])
+        if self.main_content_stack.currentWidget() != page:
+            self.main_content_stack.setCurrentWidget(page)
+            self.navigation_panel.set_nav_button_selected(nav_button)
+
     @QtCore.Slot()
     def open_pv_browser_page(self) -> None:
         """Open the PV Browser Page if it is not already open."""
-        if self.main_content_stack.currentWidget() != self.pv_browser_page:
-            self.main_content_stack.setCurrentWidget(self.pv_browser_page)
-            self.navigation_panel.set_nav_button_selected(self.navigation_panel.browse_pvs_button)
-
-            # Fixes TagWidget vertical size allocation
-            self.pv_browser_page.pv_browser_table.resizeRowsToContents()
+        self.open_nav_page(self.navigation_panel.browse_pvs_button)
 
     @QtCore.Slot()
     def open_view_snapshot_page(self) -> None:
         """Open the snapshot page if it is not already open."""
-        if self.main_content_stack.currentWidget() != self.view_snapshot_page:
-            self.main_content_stack.setCurrentWidget(self.view_snapshot_page)
-            self.navigation_panel.set_nav_button_selected(self.navigation_panel.view_snapshots_button)
+        self.open_nav_page(self.navigation_panel.view_snapshots_button)
 
     @QtCore.Slot()
     def open_configure_page(self) -> None:
         """Open the configure page if it is not already open."""
-        if self.main_content_stack.currentWidget() != self.configure_page:
-            self.main_content_stack.setCurrentWidget(self.configure_page)
-            self.navigation_panel.set_nav_button_selected(self.navigation_panel.configure_tags_button)
+        self.open_nav_page(self.navigation_panel.configure_tags_button)
 
     @QtCore.Slot(QtCore.QModelIndex)
     def open_snapshot_index(self, proxy_index: QtCore.QModelIndex) -> None:
@@ -256,12 +366,14 @@ class Window(QtWidgets.QMainWindow, metaclass=QtSingleton):
             return
 
         # Set new_snapshot in the details page
-        source_index = self.snapshot_table.model().mapToSource(proxy_index)
-        to_open = self.snapshot_table.model().sourceModel().index_to_snapshot(source_index)
+        source_index = self.snapshot_proxy_model.mapToSource(proxy_index)
+        to_open = self.snapshot_source_model.index_to_snapshot(source_index)
         self.open_snapshot(to_open)
 
     def toggle_filter_popup(self) -> None:
         """Show or hide the popup that includes the meta pv filters."""
+        if self.meta_pv_filter_popup is None:
+            self.init_meta_pv_filter_popup()
         if self.meta_pv_filter_popup.isVisible():
             self.meta_pv_filter_popup.hide()
         else:
@@ -284,19 +396,40 @@ class Window(QtWidgets.QMainWindow, metaclass=QtSingleton):
         """
         dest_snapshot = Snapshot()
         dialog = self.metadata_dialog(dest_snapshot)
-        dialog.accepted.connect(partial(self.client.snap, dest=dest_snapshot))
-        dialog.accepted.connect(partial(self.client.backend.add_snapshot, dest_snapshot))
-        dialog.accepted.connect(partial(self.open_snapshot, dest_snapshot))
-        dialog.accepted.connect(self.snapshot_table.model().sourceModel().fetch)
+        dialog.accepted.connect(partial(self._start_snapshot, dest_snapshot))
 
         dialog.open()
         return dest_snapshot
 
+    def _start_snapshot(self, dest: Snapshot) -> None:
+        """Read and save the snapshot on a worker thread so the UI stays responsive"""
+        QtCore.QThreadPool.globalInstance().start(partial(self._save_snapshot, dest))
+
+    def _save_snapshot(self, dest: Snapshot) -> None:
+        """Fill the snapshot with PV data and store it in the backend, called from a worker thread"""
+        try:
+            self.client.snap(dest=dest)
+            self.client.backend.add_snapshot(dest)
+        except Exception as e:
+            logger.exception(e)
+            self.sigSnapshotSaveFailed.emit(str(e))
+            return
+        self.sigSnapshotSaved.emit(dest)
+
+    @QtCore.Slot(object)
+    def _on_snapshot_saved(self, snapshot: Snapshot) -> None:
+        self.snapshot_source_model.fetch_in_background()
+        self.open_snapshot(snapshot)
+
+    @QtCore.Slot(str)
+    def _on_snapshot_save_failed(self, message: str) -> None:
+        QtWidgets.QMessageBox.critical(self, "Snapshot Error", f"Failed to save snapshot: {message}")
+
     def metadata_dialog(self, dest: Snapshot) -> QtWidgets.QDialog:
         """Construct dialog prompting the user to enter metadata for the given entry"""
         metadata_dialog = QtWidgets.QDialog(parent=self)
         layout = QtWidgets.QVBoxLayout()
-        layout.addWidget(NameDescTagsWidget(data=dest, tag_options=self.client.backend.get_tags()))
+        layout.addWidget(NameDescTagsWidget(data=dest, tag_options=self._get_tag_groups()))
         buttonBox = QtWidgets.QDialogButtonBox(QtWidgets.QDialogButtonBox.Save | QtWidgets.QDialogButtonBox.Cancel)
         layout.addWidget(buttonBox)
         buttonBox.accepted.connect(metadata_dialog.accept)
@@ -327,23 +460,16 @@ class Window(QtWidgets.QMainWindow, metaclass=QtSingleton):
         if not index.isValid():
             logger.warning("Invalid index passed to open_pv_details")
             return
-        data: PV
-        if isinstance(index.model(), QtCore.QSortFilterProxyModel):
-            source_model = index.model().sourceModel()
-            source_index = index.model().mapToSource(index)
-            data = source_model._data[source_index.row()]
-        elif isinstance(index.model(), PVTableModel):
-            data = index.model()._data[index.row()]
+        model = index.model()
+        for model_cls, to_source in _MODEL_TO_SOURCE:
+            if isinstance(model, model_cls):
+                break
         else:
             raise TypeError("Invalid model type passed to open_pv_details")
+        source_model, source_index = to_source(model, index)
+        data: PV = source_model._data[source_index.row()]
 
-        # Get data via the client for alarm limits
-        epics_data: EpicsData = None
-        try:
-            epics_data = self.client.cl.get(data.readback or data.setpoint)
-        except CAException as e:
-            logging.exception(e)
-
+        # Alarm limits are filled in once they have been read from the PV
         pv_details = PVDetails(
             setpoint_name=data.setpoint,
             readback_name=data.readback,
@@ -351,21 +477,17 @@ class Window(QtWidgets.QMainWindow, metaclass=QtSingleton):
             device=data.device,
             tolerance_abs=data.abs_tolerance,
             tolerance_rel=data.rel_tolerance,
-            lolo=epics_data.lower_alarm_limit if isinstance(epics_data, EpicsData) else None,
-            low=epics_data.lower_warning_limit if isinstance(epics_data, EpicsData) else None,
-            high=epics_data.upper_warning_limit if isinstance(epics_data, EpicsData) else None,
-            hihi=epics_data.upper_alarm_limit if isinstance(epics_data, EpicsData) else None,
             tags=data.tags,
         )
         popup_class = PVDetailsPopupEditable if editable else PVDetailsPopup
         self.popup = popup_class(
-            tag_groups=self.client.backend.get_tags(),
+            tag_groups=self._get_tag_groups(),
             pv_details=pv_details,
             pv_id=data.uuid
         )
         if editable:
             self.popup.accepted.connect(self.update_pv)
-            self.popup.accepted.connect(lambda: view.model().sourceModel().refetch_row(index.row()))
+            self.popup.accepted.connect(partial(view.model().sourceModel().refetch_row, index.row()))
         self.popup.adjustSize()
 
         table_top_right = view.mapToGlobal(view.rect().topRight())
@@ -375,6 +497,26 @@ class Window(QtWidgets.QMainWindow, metaclass=QtSingleton):
 
         self.popup.show()
 
+        if not editable:
+            QtCore.QThreadPool.globalInstance().start(
+                partial(self._fetch_limits, data.readback or data.setpoint, self.popup)
+            )
+
+    def _fetch_limits(self, address: str, popup: PVDetailsPopup) -> None:
+        """Read alarm limits for a PV details popup, called from a worker thread"""
+        try:
+            epics_data = self.client.cl.get(address)
+        except CAException as e:
+            logging.exception(e)
+            return
+        self.sigLimitsFetched.emit(popup, epics_data)
+
+    @QtCore.Slot(object, object)
+    def _on_limits_fetched(self, popup: PVDetailsPopup, epics_data: EpicsData) -> None:
+        # Drop limits for a popup that has since been replaced
+        if popup is self.popup:
+            popup.set_limits(epics_data)
+
     @QtCore.Slot()
     def update_pv(self):
         pv_id = self.sender().pv_id
@@ -393,7 +535,7 @@ class Window(QtWidgets.QMainWindow, metaclass=QtSingleton):
     @QtCore.Slot()
     def open_new_pv_dialog(self) -> None:
         self.popup = PVDetailsPopupEditable(
-            tag_groups=self.client.backend.get_tags(),
+            tag_groups=self._get_tag_groups(),
         )
         self.popup.adjustSize()
 
@@ -417,6 +559,10 @@ class Window(QtWidgets.QMainWindow, metaclass=QtSingleton):
         self.popup.show()
 
     def closeEvent(self, a0: QCloseEvent) -> None:
+        # Let every page's poll threads wind down together before waiting on any of them
+        for page in self.pages:
+            if isinstance(page, Page):
+                page.stop_polling()
         for page in self.pages:
             try:
                 page.close()
@@ -427,12 +573,21 @@ class Window(QtWidgets.QMainWindow, metaclass=QtSingleton):
 
 class NavigationPanel(QtWidgets.QWidget):
 
-    sigViewSnapshots = QtCore.Signal()
-    sigBrowsePVs = QtCore.Signal()
-    sigConfigureTags = QtCore.Signal()
+    sigNavButtonClicked = QtCore.Signal(QtWidgets.QAbstractButton)
     sigSave = QtCore.Signal()
     sigExpandedChanged = QtCore.Signal(bool)
 
+    # (attribute name, icon, text) for each page navigation button, in display order
+    _NAV_SPEC = (
+        ("view_snapshots_button", "ph.stack", "View Snapshots"),
+        ("browse_pvs_button", "ph.database", "Browse PVs"),
+        ("configure_tags_button", "ph.tag", "Configure Tags"),
+    )
+    _ICON_SIZE = QtCore.QSize(24, 24)
+
+    _BUG_URL = QtCore.QUrl("https://forms.office.com/r/A6p1TmFNw3")
+    _BUG_FALLBACK_TEXT = f"Unable to open the bug report form. Please visit:\n{_BUG_URL.toString()}"
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -467,47 +622,33 @@ class NavigationPanel(QtWidgets.QWidget):
 
         self.expanded = True
 
-        self.view_snapshots_button = QtWidgets.QPushButton()
-        self.view_snapshots_button.setIcon(qta.icon("ph.stack"))
-        self.view_snapshots_button.setIconSize(QtCore.QSize(24, 24))
-        self.view_snapshots_button.setText("View Snapshots")
-        self.view_snapshots_button.setFlat(True)
-        self.view_snapshots_button.setToolTip("View Snapshots")
-        self.view_snapshots_button.setProperty("icon-only", False)
-        self.view_snapshots_button.setProperty("selected", False)
-        self.view_snapshots_button.clicked.connect(self.sigViewSnapshots.emit)
-        self.layout().addWidget(self.view_snapshots_button)
-
-        self.browse_pvs_button = QtWidgets.QPushButton()
-        self.browse_pvs_button.setIcon(qta.icon("ph.database"))
-        self.browse_pvs_button.setIconSize(QtCore.QSize(24, 24))
-        self.browse_pvs_button.setText("Browse PVs")
-        self.browse_pvs_button.setFlat(True)
-        self.browse_pvs_button.setToolTip("Browse PVs")
-        self.browse_pvs_button.setProperty("icon-only", False)
-        self.browse_pvs_button.setProperty("selected", False)
-        self.browse_pvs_button.clicked.connect(self.sigBrowsePVs.emit)
-        self.layout().addWidget(self.browse_pvs_button)
-
-        self.configure_tags_button = QtWidgets.QPushButton()
-        self.configure_tags_button.setIcon(qta.icon("ph.tag"))
-        self.configure_tags_button.setIconSize(QtCore.QSize(24, 24))
-        self.configure_tags_button.setText("Configure Tags")
-        self.configure_tags_button.setFlat(True)
-        self.configure_tags_button.setToolTip("Configure Tags")
-        self.configure_tags_button.setProperty("icon-only", False)
-        self.configure_tags_button.setProperty("selected", False)
-        self.configure_tags_button.clicked.connect(self.sigConfigureTags.emit)
-        self.layout().addWidget(self.configure_tags_button)
-
-        self.nav_buttons = [self.view_snapshots_button, self.browse_pvs_button, self.configure_tags_button]
+        # Report clicks from every nav button through one signal
+        self.nav_button_group = QtWidgets.QButtonGroup(self)
+        self.nav_button_group.setExclusive(False)
+        self.nav_button_group.buttonClicked.connect(self.sigNavButtonClicked)
+
+        self.nav_buttons = []
+        for attr_name, icon_name, text in self._NAV_SPEC:
+            button = QtWidgets.QPushButton()
+            button.setIcon(cached_icon(icon_name))
+            button.setIconSize(self._ICON_SIZE)
+            button.setText(text)
+            button.setFlat(True)
+            button.setToolTip(text)
+            button.setProperty("icon-only", False)
+            button.setProperty("selected", False)
+            self.layout().addWidget(button)
+            self.nav_button_group.addButton(button)
+            setattr(self, attr_name, button)
+            self.nav_buttons.append(button)
+        self._selected_button: Optional[QtWidgets.QPushButton] = None
 
         self.layout().addStretch()
 
         self.toggle_and_bug_layout = QtWidgets.QHBoxLayout()
         self.toggle_expand_button = QtWidgets.QPushButton()
-        self.toggle_expand_button.setIcon(qta.icon("ph.arrow-line-left"))
-        self.toggle_expand_button.setIconSize(QtCore.QSize(24, 24))
+        self.toggle_expand_button.setIcon(cached_icon("ph.arrow-line-left"))
+        self.toggle_expand_button.setIconSize(self._ICON_SIZE)
         self.toggle_expand_button.setFlat(True)
         self.toggle_expand_button.setProperty("icon-only", False)
         self.toggle_expand_button.clicked.connect(self.toggle_expanded)
@@ -518,7 +659,7 @@ class NavigationPanel(QtWidgets.QWidget):
         self.layout().addLayout(self.toggle_and_bug_layout)
 
         self.bug_report_button = QtWidgets.QPushButton()
-        self.bug_report_button.setIcon(qta.icon("ph.bug"))
+        self.bug_report_button.setIcon(cached_icon("ph.bug"))
         self.bug_report_button.setIconSize(QtCore.QSize(20, 20))
         self.bug_report_button.setFlat(True)
         self.bug_report_button.setProperty("icon-only", False)
@@ -527,23 +668,55 @@ class NavigationPanel(QtWidgets.QWidget):
         self.toggle_and_bug_layout.addWidget(self.bug_report_button)
 
         self.save_button = QtWidgets.QPushButton()
-        self.save_button.setIcon(qta.icon("ph.instagram-logo"))
-        self.save_button.setIconSize(QtCore.QSize(24, 24))
+        self.save_button.setIcon(cached_icon("ph.instagram-logo"))
+        self.save_button.setIconSize(self._ICON_SIZE)
         self.save_button.setText("Save Snapshot")
         self.save_button.setProperty("icon-only", False)
         self.save_button.clicked.connect(self.sigSave.emit)
         self.save_button.setObjectName("save-snapshot-btn")
         self.layout().addWidget(self.save_button)
 
+        # (icon-only, selected) style properties of each button restyled by the panel
+        self._button_state: dict[QtWidgets.QPushButton, tuple[bool, bool]] = {
+            button: (False, False) for button in (*self.nav_buttons, self.save_button)
+        }
+
     def set_nav_button_selected(self, nav_button: QtWidgets.QPushButton) -> None:
         """Sets a nav button as selected and deselects the others.
 
         Args:
             nav_button (QtWidgets.QPushButton): The button to set as selected.
         """
-        for button in self.nav_buttons:
-            button.setProperty("selected", True if button == nav_button else False)
-        self.reset_stylesheet()
+        previous = self._selected_button
+        if previous is not None:
+            self.set_button_state(previous, selected=False)
+        self.set_button_state(nav_button, selected=True)
+        self._selected_button = nav_button
+
+    def set_button_state(
+        self,
+        button: QtWidgets.QPushButton,
+        icon_only: Optional[bool] = None,
+        selected: Optional[bool] = None,
+    ) -> None:
+        """Update the style properties of a button, repolishing it only if they changed.
+
+        Args:
+            button (QtWidgets.QPushButton): The nav or save button to update.
+            icon_only (bool, optional): The new "icon-only" property, unchanged if None.
+            selected (bool, optional): The new "selected" property, unchanged if None.
+        """
+        old_icon_only, old_selected = self._button_state[button]
+        icon_only = old_icon_only if icon_only is None else icon_only
+        selected = old_selected if selected is None else selected
+        if (icon_only, selected) == (old_icon_only, old_selected):
+            return
+        if icon_only != old_icon_only:
+            button.setProperty("icon-only", icon_only)
+        if selected != old_selected:
+            button.setProperty("selected", selected)
+        self._button_state[button] = (icon_only, selected)
+        self.repolish(button)
 
     def toggle_expanded(self) -> None:
         """Toggles the expanded state of the nav panel"""
@@ -556,41 +729,30 @@ class NavigationPanel(QtWidgets.QWidget):
             if self.expanded:
                 self.toggle_and_bug_layout.setDirection(QtWidgets.QBoxLayout.LeftToRight)
                 self.toggle_and_bug_layout.addWidget(self.bug_report_button)
-                self.toggle_expand_button.setIcon(qta.icon("ph.arrow-line-left"))
-                self.view_snapshots_button.setText("View Snapshots")
-                self.browse_pvs_button.setText("Browse PVs")
-                self.configure_tags_button.setText("Configure Tags")
+                self.toggle_expand_button.setIcon(cached_icon("ph.arrow-line-left"))
                 self.save_button.setText("Save Snapshot")
-                for button in self.nav_buttons:
-                    button.setProperty("icon-only", False)
-                self.save_button.setProperty("icon-only", False)
+                for button, (_, _, text) in zip(self.nav_buttons, self._NAV_SPEC):
+                    button.setText(text)
             else:
                 self.toggle_and_bug_layout.setDirection(QtWidgets.QBoxLayout.BottomToTop)
                 self.toggle_and_bug_layout.insertWidget(1, self.bug_report_button, alignment=QtCore.Qt.AlignCenter)
-                self.toggle_expand_button.setIcon(qta.icon("ph.arrow-line-right"))
+                self.toggle_expand_button.setIcon(cached_icon("ph.arrow-line-right"))
                 for button in self.nav_buttons:
                     button.setText("")
-                    button.setProperty("icon-only", True)
                 self.save_button.setText("")
-                self.save_button.setProperty("icon-only", True)
 
+            for button in self._button_state:
+                self.set_button_state(button, icon_only=not self.expanded)
             self.sigExpandedChanged.emit(self.expanded)
-            self.reset_stylesheet()
 
-    def reset_stylesheet(self) -> None:
-        """Clears then resets stylesheet to force recomputation. Needed when property
-        or object name driven styles should change."""
-        stylesheet = self.styleSheet()
-        self.setStyleSheet("")
-        self.setStyleSheet(stylesheet)
+    def repolish(self, *widgets: QtWidgets.QWidget) -> None:
+        """Re-apply the stylesheet to only the given widgets. Needed when property
+        driven styles should change."""
+        for widget in widgets:
+            widget.style().unpolish(widget)
+            widget.style().polish(widget)
 
     def open_bug_form(self):
         """Open Microsoft Form for bug reporting in default browser."""
-        url = QtCore.QUrl("https://forms.office.com/r/A6p1TmFNw3")
-
-        if not QtGui.QDesktopServices.openUrl(url):
-            QtWidgets.QMessageBox.warning(
-                self,
-                "Error",
-                "Unable to open the bug report form. Please visit:\nhttps://forms.office.com/r/A6p1TmFNw3",
-            )
+        if not QtGui.QDesktopServices.openUrl(self._BUG_URL):
+            QtWidgets.QMessageBox.warning(self, "Error", self._BUG_FALLBACK_TEXT)